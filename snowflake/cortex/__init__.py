@@ -1,4 +1,9 @@
-from snowflake.cortex._complete import Complete, CompleteOptions
+from snowflake.cortex._complete import (
+    Complete,
+    CompleteAsync,
+    CompleteBatch,
+    CompleteOptions,
+)
 from snowflake.cortex._extract_answer import ExtractAnswer
 from snowflake.cortex._sentiment import Sentiment
 from snowflake.cortex._summarize import Summarize
@@ -6,6 +11,8 @@ from snowflake.cortex._translate import Translate
 
 __all__ = [
     "Complete",
+    "CompleteAsync",
+    "CompleteBatch",
     "CompleteOptions",
     "ExtractAnswer",
     "Sentiment",
@@ -1,9 +1,34 @@
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import http.cookiejar
 import json
 import logging
-from typing import Iterator, List, Optional, TypedDict, Union, cast
+import re
+import threading
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 from urllib.parse import urlunparse
 
+import numpy as np
+import numpy.typing as npt
 import requests
+from requests import adapters
 from typing_extensions import NotRequired
 
 from snowflake import snowpark
@@ -12,12 +37,28 @@ from snowflake.cortex._util import (
     CORTEX_FUNCTIONS_TELEMETRY_PROJECT,
     SnowflakeAuthenticationException,
     SnowflakeConfigurationException,
+    get_empty_dataframe,
 )
 from snowflake.ml._internal import telemetry
+from snowflake.ml._internal.utils import json_utils
 from snowflake.snowpark import context, functions
 
 logger = logging.getLogger(__name__)
 
+# A shared session keeps the TCP/TLS connection to the Snowflake host alive across calls, so that repeated
+# completions do not pay for a new handshake every time. It is shared by every Snowpark session and account in the
+# process, so it must not keep cookies: only the connection pooling is shared.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("https://", adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32))
+atexit.register(_SESSION.close)
+
+# Request headers built per REST client, along with the token they were built from. Entries are dropped together with
+# the connection.
+_HEADERS_CACHE: "weakref.WeakKeyDictionary[Any, Tuple[str, Dict[str, str]]]" = weakref.WeakKeyDictionary()
+# Inference URL built per connection, along with the scheme and host it was built from.
+_URL_CACHE: "weakref.WeakKeyDictionary[Any, Tuple[str, str, str]]" = weakref.WeakKeyDictionary()
+
 
 class ConversationMessage(TypedDict):
     """Represents an conversation interaction."""
@@ -52,6 +93,253 @@ class ResponseParseException(Exception):
     pass
 
 
+class _ResponseCache:
+    """A thread-safe, in-process LRU cache of deterministic completions."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._data: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "maxsize": self._maxsize, "currsize": len(self._data)}
+
+
+_RESPONSE_CACHE = _ResponseCache()
+
+# Tokens which carry meaning that embeddings tend to blur, e.g. acronyms ("CPC" vs "CPM") and numbers.
+_SEMANTIC_GUARD_TOKEN_RE = re.compile(r"\b(?:[A-Z]{2,}|\w*\d\w*)\b")
+_DEFAULT_SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+
+
+class _SemanticCachePartition:
+    """The cached prompts of one partition, with their embeddings kept as the rows of a preallocated matrix.
+
+    The matrix grows by doubling until it holds maxsize rows, after which the oldest entry is overwritten in place.
+    """
+
+    def __init__(self, dim: int, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._matrix: npt.NDArray[np.float32] = np.empty((min(maxsize, 16), dim), dtype=np.float32)
+        self._entries: List[Tuple[Set[str], str]] = []
+        self._oldest = 0
+
+    def scores(self, embedding: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+        return self._matrix[: len(self._entries)] @ embedding
+
+    def entry(self, index: int) -> Tuple[Set[str], str]:
+        return self._entries[index]
+
+    def add(self, embedding: npt.NDArray[np.float32], entry: Tuple[Set[str], str]) -> None:
+        size = len(self._entries)
+        if size < self._maxsize:
+            if size == len(self._matrix):
+                grown = np.empty((min(self._maxsize, 2 * size), self._matrix.shape[1]), dtype=np.float32)
+                grown[:size] = self._matrix
+                self._matrix = grown
+            self._matrix[size] = embedding
+            self._entries.append(entry)
+        else:
+            self._matrix[self._oldest] = embedding
+            self._entries[self._oldest] = entry
+            self._oldest = (self._oldest + 1) % self._maxsize
+
+
+class _SemanticCache:
+    """An in-process cache returning the response of a previously seen, semantically similar prompt.
+
+    Entries are grouped by a partition key covering everything about a call but its prompt (see
+    _cache_partition_key), so a response is only ever returned for the same model, options and account. Prompts are
+    embedded and L2-normalized, so the similarity to every cached prompt of a partition is a single matrix-vector
+    product. A cached response is only returned when the best cosine similarity reaches the threshold and both prompts
+    contain exactly the same guard tokens (acronyms and numbers).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        maxsize: int = 1024,
+        encoder: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self._threshold = threshold
+        self._maxsize = maxsize
+        self._encoder = encoder
+        # Loading the default encoder may download it, so it has its own lock and is never loaded under self._lock.
+        self._encoder_lock = threading.Lock()
+        # Only guards the partitions, prompts are embedded before taking it.
+        self._lock = threading.Lock()
+        self._partitions: Dict[str, _SemanticCachePartition] = {}
+
+    def _get_encoder(self) -> Callable[[str], Any]:
+        encoder = self._encoder
+        if encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None:
+                    import sentence_transformers
+
+                    model = sentence_transformers.SentenceTransformer(_DEFAULT_SEMANTIC_CACHE_MODEL)
+                    self._encoder = model.encode
+                encoder = self._encoder
+        return encoder
+
+    def encode(self, prompt: str) -> npt.NDArray[np.float32]:
+        """Returns the L2-normalized embedding of a prompt, to be passed to both get and put for the same prompt."""
+        embedding = np.asarray(self._get_encoder()(prompt), dtype=np.float32).ravel()
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+
+    @staticmethod
+    def _guard_tokens(prompt: str) -> Set[str]:
+        return set(_SEMANTIC_GUARD_TOKEN_RE.findall(prompt))
+
+    def get(self, partition: str, prompt: str, embedding: Optional[npt.NDArray[np.float32]] = None) -> Optional[str]:
+        if embedding is None:
+            embedding = self.encode(prompt)
+        guard_tokens = self._guard_tokens(prompt)
+        with self._lock:
+            cached = self._partitions.get(partition)
+            if cached is None:
+                return None
+            scores = cached.scores(embedding)
+            best = int(np.argmax(scores))
+            best_score = scores[best]
+            best_guard_tokens, response = cached.entry(best)
+        if best_score < self._threshold or best_guard_tokens != guard_tokens:
+            return None
+        return response
+
+    def put(
+        self, partition: str, prompt: str, response: str, embedding: Optional[npt.NDArray[np.float32]] = None
+    ) -> None:
+        if embedding is None:
+            embedding = self.encode(prompt)
+        entry = (self._guard_tokens(prompt), response)
+        with self._lock:
+            cached = self._partitions.get(partition)
+            if cached is None:
+                cached = self._partitions[partition] = _SemanticCachePartition(len(embedding), self._maxsize)
+            cached.add(embedding, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+
+
+_SEMANTIC_CACHE = _SemanticCache()
+
+
+def _cache_partition_key(
+    model: str,
+    options: Optional[CompleteOptions],
+    session: Optional[snowpark.Session],
+    use_rest_api_experimental: bool,
+    function: str,
+) -> str:
+    """Returns the hash of everything about a call but its prompt, i.e. the scope in which responses can be shared."""
+    session = session or context.get_active_session()
+    host = getattr(getattr(session, "connection", None), "host", None)
+    payload = json.dumps(
+        {
+            "model": model,
+            "options": options,
+            "host": host,
+            "rest": use_rest_api_experimental,
+            "function": function,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _response_cache_key(
+    model: Union[str, snowpark.Column],
+    prompt: Union[str, List[ConversationMessage], snowpark.Column],
+    options: Optional[CompleteOptions],
+    session: Optional[snowpark.Session],
+    use_rest_api_experimental: bool,
+    stream: bool,
+    function: str,
+) -> Optional[str]:
+    """Returns the cache key of a call, or None if the call is not safe to cache.
+
+    Only single, non-streamed string prompts with a zero (or unset) temperature are cached. Conversations are never
+    cached as they may carry user specific context.
+    """
+    if stream or not isinstance(model, str) or not isinstance(prompt, str):
+        return None
+    if options is not None:
+        if not isinstance(options, dict) or options.get("temperature", 0) > 0:
+            return None
+    partition = _cache_partition_key(model, options, session, use_rest_api_experimental, function)
+    return hashlib.sha256(json.dumps([partition, prompt]).encode()).hexdigest()
+
+
+def _get_headers(rest: Any) -> Dict[str, str]:
+    token = rest.token
+    try:
+        cached = _HEADERS_CACHE.get(rest)
+    except TypeError:  # The REST client is not hashable or cannot be weakly referenced.
+        cached = None
+        rest = None
+    if cached is None or cached[0] != token:
+        cached = (
+            token,
+            {
+                "Content-Type": "application/json",
+                "Authorization": f'Snowflake Token="{token}"',
+                "Accept": "application/json, text/event-stream",
+            },
+        )
+        if rest is not None:
+            _HEADERS_CACHE[rest] = cached
+    # Callers add per request headers, so hand out a copy.
+    return dict(cached[1])
+
+
+def _get_url(connection: Any) -> str:
+    scheme = "https"
+    if hasattr(connection, "scheme"):
+        scheme = connection.scheme
+    host = connection.host
+    try:
+        cached = _URL_CACHE.get(connection)
+    except TypeError:  # The connection is not hashable or cannot be weakly referenced.
+        cached = None
+        connection = None
+    if cached is None or cached[0] != scheme or cached[1] != host:
+        cached = (scheme, host, urlunparse((scheme, host, "api/v2/cortex/inference/complete", "", "", "")))
+        if connection is not None:
+            _URL_CACHE[connection] = cached
+    return cached[2]
+
+
 def _call_complete_rest(
     model: str,
     prompt: Union[str, List[ConversationMessage]],
@@ -75,22 +363,15 @@ def _call_complete_rest(
     if session.connection.rest.token is None or session.connection.rest.token == "":
         raise SnowflakeAuthenticationException("Snowflake session error: REST token is empty.")
 
-    scheme = "https"
-    if hasattr(session.connection, "scheme"):
-        scheme = session.connection.scheme
-    url = urlunparse((scheme, session.connection.host, "api/v2/cortex/inference/complete", "", "", ""))
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f'Snowflake Token="{session.connection.rest.token}"',
-        "Accept": "application/json, text/event-stream",
-    }
+    url = _get_url(session.connection)
+
+    headers = _get_headers(session.connection.rest)
 
     data = {
         "model": model,
         "stream": stream,
     }
-    if isinstance(prompt, List):
+    if isinstance(prompt, list):
         data["messages"] = prompt
     else:
         data["messages"] = [{"content": prompt}]
@@ -104,10 +385,14 @@ def _call_complete_rest(
         if "top_p" in options:
             data["top_p"] = options["top_p"]
 
+    # The body is serialized once up front and sent as-is, so requests does not re-encode it.
+    body = json_utils.dumps(data)
+    headers["Content-Length"] = str(len(body))
+
     logger.debug(f"making POST request to {url} (model={model}, stream={stream})")
-    response = requests.post(
+    response = _SESSION.post(
         url,
-        json=data,
+        data=body,
         headers=headers,
         stream=stream,
     )
@@ -115,12 +400,59 @@ def _call_complete_rest(
     return response
 
 
+@telemetry.send_api_usage_telemetry(
+    project=CORTEX_FUNCTIONS_TELEMETRY_PROJECT,
+)
+def _complete_rest_blocking(
+    model: str,
+    prompt: Union[str, List[ConversationMessage]],
+    options: Optional[CompleteOptions],
+    session: Optional[snowpark.Session],
+) -> str:
+    # Runs in an executor on behalf of CompleteAsync, so that telemetry covers the request and its errors without
+    # blocking the event loop.
+    response = _call_complete_rest(model, prompt, options, session=session, stream=False)
+    return cast(str, _process_rest_response(response, stream=False))
+
+
+async def _complete_rest_async(
+    model: str,
+    prompt: Union[str, List[ConversationMessage]],
+    options: Optional[CompleteOptions] = None,
+    session: Optional[snowpark.Session] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """Awaitable, non-streaming REST completion.
+
+    Many of these can be awaited together (e.g. with asyncio.gather) so that independent completions are in flight
+    concurrently over the pooled connections. An optional semaphore bounds the number of concurrent requests.
+
+    Args:
+        model: The model to use.
+        prompt: A prompt string or a list of ConversationMessage.
+        options: A instance of snowflake.cortex.CompleteOptions
+        session: The snowpark session to use. Will be inferred by context if not specified.
+        semaphore: Limits the number of requests in flight when provided.
+
+    Returns:
+        The completion.
+    """
+    # The session is resolved on the calling thread since the active session is looked up from the context.
+    session = session or context.get_active_session()
+    call = functools.partial(_complete_rest_blocking, model, prompt, options, session)
+    loop = asyncio.get_running_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(None, call)
+    async with semaphore:
+        return await loop.run_in_executor(None, call)
+
+
 def _process_rest_response(response: requests.Response, stream: bool = False) -> Union[str, Iterator[str]]:
     if stream:
         return _return_stream_response(response)
 
     try:
-        content = response.json()["choices"][0]["message"]["content"]
+        content = json_utils.loads(response.content)["choices"][0]["message"]["content"]
         assert isinstance(content, str)
         return content
     except (KeyError, IndexError, AssertionError) as e:
@@ -132,8 +464,8 @@ def _return_stream_response(response: requests.Response) -> Iterator[str]:
     client = SSEClient(response)
     for event in client.events():
         try:
-            yield json.loads(event.data)["choices"][0]["delta"]["content"]
-        except (json.JSONDecodeError, KeyError, IndexError):
+            yield json_utils.loads(event.data)["choices"][0]["delta"]["content"]
+        except (json_utils.JSONDecodeError, KeyError, IndexError):
             # For the sake of evolution of the output format,
             # ignore stream messages that don't match the expected format.
             pass
@@ -161,7 +493,7 @@ def _complete_call_sql_function_immediate(
 
     # https://docs.snowflake.com/en/sql-reference/functions/complete-snowflake-cortex
     if options is not None or not isinstance(prompt, str):
-        if isinstance(prompt, List):
+        if isinstance(prompt, list):
             prompt_arg = prompt
         else:
             prompt_arg = [{"role": "user", "content": prompt}]
@@ -177,11 +509,49 @@ def _complete_call_sql_function_immediate(
             functions.lit(prompt),
         ]
 
-    empty_df = session.create_dataframe([snowpark.Row()])
-    df = empty_df.select(functions.builtin(function)(*lit_args))
+    df = get_empty_dataframe(session).select(functions.builtin(function)(*lit_args))
     return cast(str, df.collect()[0][0])
 
 
+def _complete_call_sql_function_batch(
+    function: str,
+    model: str,
+    prompts: List[Union[str, List[ConversationMessage]]],
+    options: Optional[CompleteOptions],
+    session: Optional[snowpark.Session],
+) -> List[str]:
+    session = session or context.get_active_session()
+    if session is None:
+        raise SnowflakeAuthenticationException(
+            """Session required. Provide the session through a session=... argument or ensure an active session is
+            available in your environment."""
+        )
+
+    # All prompts are sent as the rows of a single dataframe, so the batch takes one query instead of one per prompt.
+    # The row index restores the input order of the results.
+    if options is None and all(isinstance(prompt, str) for prompt in prompts):
+        rows = [snowpark.Row(IDX=i, PROMPT=prompt) for i, prompt in enumerate(prompts)]
+        args = [functions.lit(model), functions.col("PROMPT")]
+    else:
+        rows = [
+            snowpark.Row(
+                IDX=i,
+                PROMPT=json_utils.dumps_str(
+                    prompt if isinstance(prompt, list) else [{"role": "user", "content": prompt}]
+                ),
+            )
+            for i, prompt in enumerate(prompts)
+        ]
+        args = [
+            functions.lit(model),
+            functions.to_array(functions.parse_json(functions.col("PROMPT"))),
+            functions.lit(options or {}),
+        ]
+
+    df = session.create_dataframe(rows).select(functions.col("IDX"), functions.builtin(function)(*args))
+    return [cast(str, row[1]) for row in df.sort(functions.col("IDX")).collect()]
+
+
 def _complete_sql_impl(
     function: str,
     model: Union[str, snowpark.Column],
@@ -213,7 +583,7 @@ def _complete_impl(
     if use_rest_api_experimental:
         if not isinstance(model, str):
             raise ValueError("in REST mode, 'model' must be a string")
-        if not isinstance(prompt, str) and not isinstance(prompt, List):
+        if not isinstance(prompt, str) and not isinstance(prompt, list):
             raise ValueError("in REST mode, 'prompt' must be a string or a list of ConversationMessage")
         response = _call_complete_rest(model, prompt, options, session=session, stream=stream)
         return _process_rest_response(response, stream=stream)
@@ -222,6 +592,68 @@ def _complete_impl(
     return _complete_sql_impl(function, model, prompt, options, session)
 
 
+def _complete_batch_impl(
+    model: str,
+    prompts: List[Union[str, List[ConversationMessage]]],
+    options: Optional[CompleteOptions] = None,
+    session: Optional[snowpark.Session] = None,
+    use_rest_api_experimental: bool = False,
+    max_concurrency: int = 8,
+    function: str = "snowflake.cortex.complete",
+) -> List[str]:
+    if max_concurrency < 1:
+        raise ValueError("'max_concurrency' must be at least 1")
+    if not prompts:
+        return []
+    if not use_rest_api_experimental:
+        return _complete_call_sql_function_batch(function, model, prompts, options, session)
+
+    session = session or context.get_active_session()
+
+    def _complete_one(prompt: Union[str, List[ConversationMessage]]) -> str:
+        response = _call_complete_rest(model, prompt, options, session=session, stream=False)
+        return cast(str, _process_rest_response(response, stream=False))
+
+    # The requests share the pooled connections of _SESSION, results are returned in input order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as executor:
+        return list(executor.map(_complete_one, prompts))
+
+
+def _complete_impl_with_cache(
+    model: Union[str, snowpark.Column],
+    prompt: Union[str, List[ConversationMessage], snowpark.Column],
+    options: Optional[CompleteOptions] = None,
+    session: Optional[snowpark.Session] = None,
+    use_rest_api_experimental: bool = False,
+    stream: bool = False,
+    function: str = "snowflake.cortex.complete",
+    use_semantic_cache: bool = False,
+) -> Union[str, Iterator[str], snowpark.Column]:
+    key = _response_cache_key(model, prompt, options, session, use_rest_api_experimental, stream, function)
+    if key is None:
+        return _complete_impl(model, prompt, options, session, use_rest_api_experimental, stream, function)
+    assert isinstance(model, str) and isinstance(prompt, str)
+
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    partition = None
+    embedding = None
+    if use_semantic_cache:
+        partition = _cache_partition_key(model, options, session, use_rest_api_experimental, function)
+        # Embedded once, the same embedding is stored on a miss.
+        embedding = _SEMANTIC_CACHE.encode(prompt)
+        cached = _SEMANTIC_CACHE.get(partition, prompt, embedding)
+        if cached is not None:
+            return cached
+    result = _complete_impl(model, prompt, options, session, use_rest_api_experimental, stream, function)
+    if isinstance(result, str):
+        _RESPONSE_CACHE.put(key, result)
+        if partition is not None:
+            _SEMANTIC_CACHE.put(partition, prompt, result, embedding)
+    return result
+
+
 @telemetry.send_api_usage_telemetry(
     project=CORTEX_FUNCTIONS_TELEMETRY_PROJECT,
 )
@@ -233,6 +665,7 @@ def Complete(
     session: Optional[snowpark.Session] = None,
     use_rest_api_experimental: bool = False,
     stream: bool = False,
+    use_semantic_cache: bool = False,
 ) -> Union[str, Iterator[str], snowpark.Column]:
     """Complete calls into the LLM inference service to perform completion.
 
@@ -246,6 +679,12 @@ def Complete(
         stream (bool): Enables streaming. When enabled, a generator function is returned that provides the streaming
             output as it is received. Each update is a string containing the new text content since the previous update.
             The use of streaming requires the experimental use_rest_api_experimental flag to be enabled.
+        use_semantic_cache (bool): Additionally returns the cached response of a previous, semantically similar prompt
+            for the same model, options and account. Prompts are embedded locally, which requires sentence-transformers
+            to be installed.
+
+    Non-streamed completions of a single string prompt with a zero (or unset) temperature are cached in-process.
+    Use `Complete.cache_clear()` to drop cached responses and `Complete.cache_info()` to inspect hits and misses.
 
     Raises:
         ValueError: If `stream` is set to True and `use_rest_api_experimental` is set to False.
@@ -254,6 +693,75 @@ def Complete(
         A column of string responses.
     """
     try:
-        return _complete_impl(model, prompt, options, session, use_rest_api_experimental, stream)
+        return _complete_impl_with_cache(
+            model, prompt, options, session, use_rest_api_experimental, stream, use_semantic_cache=use_semantic_cache
+        )
     except ValueError as err:
         raise err
+
+
+def _cache_clear() -> None:
+    _RESPONSE_CACHE.clear()
+    _SEMANTIC_CACHE.clear()
+
+
+Complete.cache_clear = _cache_clear  # type: ignore[attr-defined]
+Complete.cache_info = _RESPONSE_CACHE.info  # type: ignore[attr-defined]
+
+
+@telemetry.send_api_usage_telemetry(
+    project=CORTEX_FUNCTIONS_TELEMETRY_PROJECT,
+)
+def CompleteBatch(
+    model: str,
+    prompts: List[Union[str, List[ConversationMessage]]],
+    *,
+    options: Optional[CompleteOptions] = None,
+    session: Optional[snowpark.Session] = None,
+    use_rest_api_experimental: bool = False,
+    max_concurrency: int = 8,
+) -> List[str]:
+    """CompleteBatch calls into the LLM inference service to perform completion of many prompts at once.
+
+    In SQL mode all prompts are completed by a single query. In REST mode the requests are sent concurrently.
+
+    Args:
+        model: The model to use for all prompts.
+        prompts: A list of prompts, each being a string or a list of ConversationMessage.
+        options: A instance of snowflake.cortex.CompleteOptions applied to all prompts.
+        session: The snowpark session to use. Will be inferred by context if not specified.
+        use_rest_api_experimental (bool): Toggles between the use of SQL and REST implementation. This feature is
+            experimental and can be removed at any time.
+        max_concurrency (int): The maximum number of requests in flight in REST mode.
+
+    Returns:
+        A list of string responses, in the order of the prompts.
+    """
+    return _complete_batch_impl(model, prompts, options, session, use_rest_api_experimental, max_concurrency)
+
+
+async def CompleteAsync(
+    model: str,
+    prompt: Union[str, List[ConversationMessage]],
+    *,
+    options: Optional[CompleteOptions] = None,
+    session: Optional[snowpark.Session] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """CompleteAsync is an awaitable completion through the LLM inference REST service.
+
+    Many calls can be awaited together, e.g. with asyncio.gather, so that independent completions are in flight
+    concurrently over pooled connections. The request itself, and its usage telemetry, run in the event loop's default
+    executor. This API uses the experimental REST implementation and can be changed or removed at any time.
+
+    Args:
+        model: The model to use.
+        prompt: A prompt string or a list of ConversationMessage.
+        options: A instance of snowflake.cortex.CompleteOptions
+        session: The snowpark session to use. Will be inferred by context if not specified.
+        semaphore: Limits the number of requests in flight when provided.
+
+    Returns:
+        The string response.
+    """
+    return await _complete_rest_async(model, prompt, options, session=session, semaphore=semaphore)
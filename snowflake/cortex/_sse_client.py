@@ -1,4 +1,4 @@
-from typing import Iterator, cast
+from typing import Iterator, List, Optional
 
 import requests
 
@@ -22,59 +22,73 @@ class SSEClient:
 
         self.response = response
 
-    def _read(self) -> Iterator[str]:
+    def _read_lines(self) -> Iterator[bytes]:
+        """Yields the lines of the stream as they arrive, without their line terminators.
 
-        lines = b""
+        Lines are split from the raw chunks here rather than with response.iter_lines(), which emits a spurious empty
+        line, and thus an event boundary, when a "\r\n" terminator is split across two chunks.
+        """
+        # Lines longer than a chunk are accumulated in place instead of by repeated bytes concatenation.
+        partial = bytearray()
+        skip_lf = False
         for chunk in self.response:
-            for line in chunk.splitlines(True):
-                lines += line
-                if lines.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield cast(str, lines)
-                    lines = b""
-        if lines:
-            yield cast(str, lines)
-
-    def events(self) -> Iterator[Event]:
-        for raw_event in self._read():
-            event = Event()
+            if skip_lf and chunk.startswith(b"\n"):
+                # The "\r\n" terminator was split across two chunks.
+                chunk = chunk[1:]
+            skip_lf = False
             # splitlines() only uses \r and \n
-            for line in raw_event.splitlines():
-
-                line = cast(bytes, line).decode("utf-8")
-
-                data = line.split(":", 1)
-                field = data[0]
-
-                if len(data) > 1:
-                    # "If value starts with a single U+0020 SPACE character,
-                    # remove it from value. .strip() would remove all white spaces"
-                    if data[1].startswith(" "):
-                        value = data[1][1:]
+            for line in chunk.splitlines(True):
+                if line.endswith((b"\r", b"\n")):
+                    if partial:
+                        partial += line.rstrip(b"\r\n")
+                        yield bytes(partial)
+                        partial.clear()
                     else:
-                        value = data[1]
+                        yield line.rstrip(b"\r\n")
+                    skip_lf = line.endswith(b"\r")
                 else:
-                    value = ""
-
-                # The data field may come over multiple lines and their values
-                # are concatenated with each other.
-                if field == "data":
-                    event.data += value + "\n"
-                elif field == "event":
-                    event.event = value
+                    partial += line
+        if partial:
+            yield bytes(partial)
+
+    @staticmethod
+    def _dispatch(event_name: str, data: List[str]) -> Optional[Event]:
+        if not data:
+            return None
+        # Empty event names default to 'message'
+        event_name = event_name or "message"
+        if event_name != "message":  # ignore anything but “message” or default event
+            return None
+        # The data field may come over multiple lines and their values are concatenated with each other.
+        return Event(event=event_name, data="\n".join(data))
 
-            if not event.data:
+    def events(self) -> Iterator[Event]:
+        event_name = ""
+        data: List[str] = []
+        for raw_line in self._read_lines():
+            # An empty line terminates the current event.
+            if not raw_line:
+                event = self._dispatch(event_name, data)
+                if event is not None:
+                    yield event
+                event_name = ""
+                data = []
                 continue
 
-            # If the data field ends with a newline, remove it.
-            if event.data.endswith("\n"):
-                event.data = event.data[0:-1]  # Replace trailing newline - rstrip would remove multiple.
+            line = raw_line.decode("utf-8")
+            field, _, value = line.partition(":")
+            # "If value starts with a single U+0020 SPACE character,
+            # remove it from value. .strip() would remove all white spaces"
+            if value[:1] == " ":
+                value = value[1:]
 
-            # Empty event names default to 'message'
-            event.event = event.event or "message"
-
-            if event.event != "message":  # ignore anything but “message” or default event
-                continue
+            if field == "data":
+                data.append(value)
+            elif field == "event":
+                event_name = value
 
+        event = self._dispatch(event_name, data)
+        if event is not None:
             yield event
 
     def close(self) -> None:
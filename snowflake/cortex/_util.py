@@ -1,3 +1,5 @@
+import collections
+import threading
 from typing import Dict, Optional, Union, cast
 
 from snowflake import snowpark
@@ -5,6 +7,12 @@ from snowflake.snowpark import context, functions
 
 CORTEX_FUNCTIONS_TELEMETRY_PROJECT = "CortexFunctions"
 
+# Single row dataframes used to evaluate functions on literals, for the most recently used sessions. A dataframe keeps
+# its session alive, so the cache is bounded instead of weakly keyed, and the session id cannot be reused meanwhile.
+_EMPTY_DF_CACHE_SIZE = 8
+_EMPTY_DF_CACHE: "collections.OrderedDict[int, snowpark.DataFrame]" = collections.OrderedDict()
+_EMPTY_DF_CACHE_LOCK = threading.Lock()
+
 
 class SnowflakeAuthenticationException(Exception):
     """This exception is raised when there is an issue with Snowflake's configuration."""
@@ -61,6 +69,23 @@ def _call_sql_function_immediate(
     for arg in args:
         lit_args.append(functions.lit(arg))
 
-    empty_df = session.create_dataframe([snowpark.Row()])
+    empty_df = get_empty_dataframe(session)
     df = empty_df.select(functions.builtin(function)(*lit_args))
     return cast(str, df.collect()[0][0])
+
+
+def get_empty_dataframe(session: snowpark.Session) -> snowpark.DataFrame:
+    """Returns a cached single row dataframe of the session, to select function calls on literals from."""
+    key = id(session)
+    with _EMPTY_DF_CACHE_LOCK:
+        empty_df = _EMPTY_DF_CACHE.get(key)
+        if empty_df is not None:
+            _EMPTY_DF_CACHE.move_to_end(key)
+            return empty_df
+
+    empty_df = session.create_dataframe([snowpark.Row()])
+    with _EMPTY_DF_CACHE_LOCK:
+        _EMPTY_DF_CACHE[key] = empty_df
+        if len(_EMPTY_DF_CACHE) > _EMPTY_DF_CACHE_SIZE:
+            _EMPTY_DF_CACHE.popitem(last=False)
+    return empty_df
@@ -1,4 +1,6 @@
+import asyncio
 import http.server
+import inspect
 import json
 import threading
 import unittest
@@ -8,6 +10,7 @@ from types import GeneratorType
 from typing import Dict, Iterable, Iterator, List, cast
 
 import _test_util
+import numpy as np
 import requests
 from absl.testing import absltest
 from requests.exceptions import HTTPError
@@ -100,6 +103,11 @@ class CompleteSQLBackendTest(absltest.TestCase):
         res = df_out.collect()[0][0]
         self.assertEqual(self.complete_for_test(self.model, self.prompt), res)
 
+    def test_complete_batch_sql_mode(self) -> None:
+        prompts = [f"{self.prompt}{i}" for i in range(3)]
+        res = _complete._complete_batch_impl(self.model, prompts, session=self._session, function="complete")
+        self.assertEqual([self.complete_for_test(self.model, p) for p in prompts], res)
+
     def test_stream_in_sql_mode(self) -> None:
         self.assertRaises(
             ValueError,
@@ -157,6 +165,27 @@ class CompleteOptionsSQLBackendTest(absltest.TestCase):
         res = _complete._complete_impl(self.model, prompt, options=_OPTIONS, session=self._session, function="complete")
         self.assertEqual(self.format_as_complete(self.model, equivalent_prompt_for_sql, _OPTIONS), res)
 
+    def test_batch_populated_options(self) -> None:
+        conversation_history_prompt = [
+            ConversationMessage({"role": "system", "content": "content for system"}),
+            ConversationMessage({"role": "user", "content": "content for user"}),
+        ]
+        equivalent_prompt_for_sql = [ConversationMessage({"role": "user", "content": "|prompt|"})]
+        res = _complete._complete_batch_impl(
+            self.model,
+            ["|prompt|", conversation_history_prompt],
+            options=_OPTIONS,
+            session=self._session,
+            function="complete",
+        )
+        self.assertEqual(
+            [
+                self.format_as_complete(self.model, equivalent_prompt_for_sql, _OPTIONS),
+                self.format_as_complete(self.model, conversation_history_prompt, _OPTIONS),
+            ],
+            res,
+        )
+
     def test_empty_options(self) -> None:
         prompt = "|prompt|"
         equivalent_prompt_for_sql = [ConversationMessage({"role": "user", "content": "|prompt|"})]
@@ -166,6 +195,77 @@ class CompleteOptionsSQLBackendTest(absltest.TestCase):
         self.assertEqual(self.format_as_complete(self.model, equivalent_prompt_for_sql, CompleteOptions()), res)
 
 
+class SemanticCacheTest(absltest.TestCase):
+    @staticmethod
+    def _bag_of_words(prompt: str) -> np.ndarray:
+        vocabulary = ["summar", "report", "cpc", "cpm", "weather"]
+        words = prompt.lower().replace("?", "").split()
+        return np.array([float(any(w.startswith(v) for w in words)) for v in vocabulary])
+
+    def setUp(self) -> None:
+        self._cache = _complete._SemanticCache(threshold=0.6, encoder=self._bag_of_words)
+
+    def test_similar_prompt_hit(self) -> None:
+        self._cache.put("m", "Summarize the report", "answer")
+        self.assertEqual("answer", self._cache.get("m", "Give me a summary of the report"))
+
+    def test_different_prompt_miss(self) -> None:
+        self._cache.put("m", "Summarize the report", "answer")
+        self.assertIsNone(self._cache.get("m", "What is the weather?"))
+
+    def test_other_model_miss(self) -> None:
+        self._cache.put("m", "Summarize the report", "answer")
+        self.assertIsNone(self._cache.get("other", "Summarize the report"))
+
+    def test_guard_tokens_miss(self) -> None:
+        self._cache.put("m", "Summarize the CPC report", "answer")
+        self.assertIsNone(self._cache.get("m", "Summarize the CPM report"))
+
+    def test_maxsize(self) -> None:
+        cache = _complete._SemanticCache(threshold=0.6, maxsize=1, encoder=self._bag_of_words)
+        cache.put("m", "Summarize the report", "answer")
+        cache.put("m", "What is the weather?", "sunny")
+        self.assertIsNone(cache.get("m", "Summarize the report"))
+        self.assertEqual("sunny", cache.get("m", "What is the weather?"))
+
+    def test_maxsize_overwrites_oldest(self) -> None:
+        cache = _complete._SemanticCache(threshold=0.99, maxsize=40, encoder=lambda prompt: np.eye(64)[int(prompt)])
+        for i in range(50):
+            cache.put("m", str(i), f"response_{i}")
+        self.assertIsNone(cache.get("m", "9"))
+        self.assertEqual("response_10", cache.get("m", "10"))
+        self.assertEqual("response_49", cache.get("m", "49"))
+
+    def test_embedding_reused_outside_of_lock(self) -> None:
+        encoded_prompts = []
+
+        def _encoder(prompt: str) -> np.ndarray:
+            # Embedding is slow, so it must not block other threads using the cache.
+            self.assertFalse(cache._lock.locked())
+            encoded_prompts.append(prompt)
+            return self._bag_of_words(prompt)
+
+        cache = _complete._SemanticCache(threshold=0.6, encoder=_encoder)
+        embedding = cache.encode("Summarize the report")
+        self.assertIsNone(cache.get("m", "Summarize the report", embedding))
+        cache.put("m", "Summarize the report", "answer", embedding)
+        self.assertEqual(["Summarize the report"], encoded_prompts)
+        self.assertEqual("answer", cache.get("m", "Give me a summary of the report"))
+        self.assertEqual(["Summarize the report", "Give me a summary of the report"], encoded_prompts)
+
+    def test_partition_key(self) -> None:
+        def _session(host: str) -> snowpark.Session:
+            return cast(snowpark.Session, FakeSession(FakeConnParams(rest=FakeToken(), scheme="https", host=host)))
+
+        key = _complete._cache_partition_key("m", None, _session("account1"), False, "complete")
+        self.assertEqual(key, _complete._cache_partition_key("m", None, _session("account1"), False, "complete"))
+        self.assertNotEqual(key, _complete._cache_partition_key("m", None, _session("account2"), False, "complete"))
+        self.assertNotEqual(
+            key, _complete._cache_partition_key("m", {"max_tokens": 10}, _session("account1"), False, "complete")
+        )
+        self.assertNotEqual(key, _complete._cache_partition_key("m", None, _session("account1"), True, "complete"))
+
+
 class MockIpifyHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
     """HTTPServer mock request handler"""
 
@@ -214,6 +314,7 @@ class MockIpifyHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
 
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Set-Cookie", "session=account1")
         self.end_headers()
 
         if model == _UNEXPECTED_RESPONSE_FORMAT_MODEL_NAME:
@@ -246,6 +347,97 @@ class CompleteRESTBackendTest(unittest.TestCase):
         )
         self.assertEqual("This is a non streaming response", result)
 
+    def test_non_streaming_does_not_keep_cookies(self) -> None:
+        _complete._complete_impl(
+            model="my_models", prompt="test_prompt", session=self.session, stream=False, use_rest_api_experimental=True
+        )
+        # The pooled session is shared across accounts, so cookies set by the server must not be stored.
+        self.assertEqual(0, len(_complete._SESSION.cookies))
+
+    def test_non_streaming_async(self) -> None:
+        async def _run() -> List[str]:
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                *[
+                    _complete.CompleteAsync("my_models", f"test_prompt_{i}", session=self.session, semaphore=semaphore)
+                    for i in range(4)
+                ]
+            )
+
+        self.assertTrue(inspect.iscoroutinefunction(_complete.CompleteAsync))
+        result = asyncio.run(_run())
+        self.assertEqual(["This is a non streaming response"] * 4, result)
+
+    def test_non_streaming_async_error(self) -> None:
+        # The request runs when the coroutine is awaited, which is where its errors are raised.
+        with self.assertRaises(HTTPError) as cm:
+            asyncio.run(_complete.CompleteAsync(_MISSING_MODEL_NAME, "test_prompt", session=self.session))
+        self.assertEqual(400, cm.exception.response.status_code)
+
+    def test_non_streaming_cache(self) -> None:
+        _complete._RESPONSE_CACHE.clear()
+        for _ in range(3):
+            result = _complete._complete_impl_with_cache(
+                model="my_models", prompt="test_prompt", session=self.session, use_rest_api_experimental=True
+            )
+            self.assertEqual("This is a non streaming response", result)
+        info = _complete._RESPONSE_CACHE.info()
+        self.assertEqual(1, info["misses"])
+        self.assertEqual(2, info["hits"])
+        self.assertEqual(1, info["currsize"])
+
+        # Non-zero temperature is not deterministic, so it bypasses the cache.
+        _complete._complete_impl_with_cache(
+            model="my_models",
+            prompt="test_prompt",
+            options=_OPTIONS,
+            session=self.session,
+            use_rest_api_experimental=True,
+        )
+        self.assertEqual(1, _complete._RESPONSE_CACHE.info()["currsize"])
+        _complete._RESPONSE_CACHE.clear()
+
+    def test_non_streaming_batch(self) -> None:
+        result = _complete._complete_batch_impl(
+            model="my_models",
+            prompts=[f"test_prompt_{i}" for i in range(5)],
+            session=self.session,
+            use_rest_api_experimental=True,
+            max_concurrency=2,
+        )
+        self.assertEqual(["This is a non streaming response"] * 5, result)
+
+    def test_headers_cache(self) -> None:
+        class Rest:
+            token = "abc"
+
+        rest = Rest()
+        headers = _complete._get_headers(rest)
+        self.assertEqual('Snowflake Token="abc"', headers["Authorization"])
+        headers["Content-Length"] = "1"
+        self.assertNotIn("Content-Length", _complete._get_headers(rest))
+        self.assertIn(rest, _complete._HEADERS_CACHE)
+
+        # A refreshed token rebuilds the headers.
+        rest.token = "def"
+        self.assertEqual('Snowflake Token="def"', _complete._get_headers(rest)["Authorization"])
+
+    def test_url_cache(self) -> None:
+        class Connection:
+            scheme = "https"
+            host = "account.snowflakecomputing.com"
+
+        connection = Connection()
+        self.assertEqual(
+            "https://account.snowflakecomputing.com/api/v2/cortex/inference/complete", _complete._get_url(connection)
+        )
+        self.assertIn(connection, _complete._URL_CACHE)
+
+        connection.host = "other.snowflakecomputing.com"
+        self.assertEqual(
+            "https://other.snowflakecomputing.com/api/v2/cortex/inference/complete", _complete._get_url(connection)
+        )
+
     def test_wrong_token(self) -> None:
         headers = {"Authorization": "Wrong Token=123"}
         data = {"stream": "hh"}
@@ -9,6 +9,8 @@ class PackageVisibilityTest(absltest.TestCase):
     def test_complete_visible(self) -> None:
         self.assertTrue(callable(cortex.Complete))
         self.assertTrue(callable(cortex.CompleteOptions))
+        self.assertTrue(callable(cortex.CompleteBatch))
+        self.assertTrue(callable(cortex.CompleteAsync))
 
     def test_extract_answer_visible(self) -> None:
         self.assertTrue(callable(cortex.ExtractAnswer))
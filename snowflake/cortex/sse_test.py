@@ -84,6 +84,20 @@ class SSETest(absltest.TestCase):
 
         assert result_parsed == ["one", "two\nthree"]  # not combined
 
+    def test_crlf_line_separator(self) -> None:
+        # test if "\r\n" terminators are handled even when split across chunks
+        # fmt: off
+        response_crlf = (
+            b"data: one\r\n\r\n"
+            b"data: two\r\n"
+            b"data: three\r\n\r\n"
+        )
+        # fmt: on
+
+        result_parsed = _streaming_messages(response_crlf)
+
+        assert result_parsed == ["one", "two\nthree"]
+
     def test_combined_data(self) -> None:
         # test if data is combined if it has trailing \n
         # fmt: off
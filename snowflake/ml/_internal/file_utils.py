@@ -11,6 +11,7 @@ import sys
 import tarfile
 import tempfile
 import zipfile
+from concurrent import futures
 from typing import (
     Any,
     Callable,
@@ -29,6 +30,7 @@ import cloudpickle
 from snowflake import snowpark
 from snowflake.ml._internal.exceptions import exceptions
 from snowflake.snowpark import exceptions as snowpark_exceptions
+from snowflake.snowpark._internal import utils as snowpark_utils
 
 GENERATED_PY_FILE_EXT = (".pyc", ".pyo", ".pyd", ".pyi")
 
@@ -130,6 +132,49 @@ def make_archive(
     )
 
 
+def make_zip_archive(
+    target_path: str,
+    root_dir: str,
+    copy_dir: Optional[str] = None,
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> None:
+    """Zip the content of a directory in a single walk, optionally keeping a loose copy of it.
+
+    The archive has the same layout as `make_archive(target_path, root_dir)`. Files in the loose copy are hard links
+    to the source files when the file system allows it, so large model files are not written to disk twice.
+
+    Args:
+        target_path: Path of the zip file to create.
+        root_dir: Directory whose content is archived.
+        copy_dir: Directory to place a loose copy of the content of root_dir in. It must not exist yet. Defaults to
+            None, meaning no loose copy is made.
+        compression: Compression method of the archive entries. Defaults to zipfile.ZIP_DEFLATED.
+    """
+    with zipfile.ZipFile(target_path, mode="w", compression=compression) as zf:
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            rel_dirpath = os.path.relpath(dirpath, root_dir)
+            if copy_dir is not None:
+                os.makedirs(os.path.normpath(os.path.join(copy_dir, rel_dirpath)), exist_ok=rel_dirpath != os.curdir)
+            for name in sorted(dirnames):
+                zf.write(os.path.join(dirpath, name), os.path.normpath(os.path.join(rel_dirpath, name)))
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if not os.path.isfile(path):
+                    continue
+                arcname = os.path.normpath(os.path.join(rel_dirpath, name))
+                # ZipFile.write copies in 8 KiB chunks, which adds up for large model files.
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                zinfo.compress_type = compression
+                with open(path, "rb") as src, zf.open(zinfo, mode="w") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                if copy_dir is not None:
+                    copy_path = os.path.join(copy_dir, arcname)
+                    try:
+                        os.link(path, copy_path)
+                    except OSError:
+                        shutil.copyfile(path, copy_path)
+
+
 def zip_python_package(zipfile_path: str, package_name: str, ignore_generated_py_file: bool = True) -> None:
     import importlib_resources
     from importlib_resources import abc as importlib_resources_abc
@@ -297,19 +342,33 @@ def upload_directory_to_stage(
     stage_path: pathlib.PurePosixPath,
     *,
     statement_params: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Upload a local folder recursively to a stage and keep the structure.
 
+    Files are uploaded concurrently, as each PUT is dominated by encryption and network time rather than by the
+    client. Inside a stored procedure, where the session is bound to the procedure's single connection, files are
+    uploaded one after another.
+
     Args:
         session: Snowpark Session.
         local_path: Local path to upload.
         stage_path: Base path in the stage.
         statement_params: Statement Params.
+        max_workers: Maximum number of files uploaded at the same time. Defaults to None, meaning twice the number of
+            CPUs, capped at 32.
     """
     import retrying
 
     file_operation = snowpark.FileOperation(session=session)
-
+    put_with_retry = retrying.retry(
+        retry_on_exception=_retry_on_sql_error,
+        stop_max_attempt_number=5,
+        wait_exponential_multiplier=100,
+        wait_exponential_max=10000,
+    )(file_operation.put)
+
+    uploads: List[Tuple[pathlib.Path, pathlib.PurePosixPath]] = []
     for root, _, filenames in os.walk(local_path):
         root_path = pathlib.Path(root)
         for filename in filenames:
@@ -317,18 +376,29 @@ def upload_directory_to_stage(
             stage_dir_path = (
                 stage_path / pathlib.PurePosixPath(local_file_path.relative_to(local_path).as_posix()).parent
             )
-            retrying.retry(
-                retry_on_exception=_retry_on_sql_error,
-                stop_max_attempt_number=5,
-                wait_exponential_multiplier=100,
-                wait_exponential_max=10000,
-            )(file_operation.put)(
-                str(local_file_path),
-                str(stage_dir_path),
-                auto_compress=False,
-                overwrite=False,
-                statement_params=statement_params,
-            )
+            uploads.append((local_file_path, stage_dir_path))
+
+    def _upload(upload: Tuple[pathlib.Path, pathlib.PurePosixPath]) -> None:
+        local_file_path, stage_dir_path = upload
+        put_with_retry(
+            str(local_file_path),
+            str(stage_dir_path),
+            auto_compress=False,
+            overwrite=False,
+            statement_params=statement_params,
+        )
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
+    in_sproc = snowpark_utils.is_in_stored_procedure()  # type: ignore[no-untyped-call]
+    if len(uploads) <= 1 or max_workers <= 1 or in_sproc:
+        for upload in uploads:
+            _upload(upload)
+        return
+
+    with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(uploads))) as executor:
+        # Consume the results so that the first failed upload raises.
+        list(executor.map(_upload, uploads))
 
 
 def download_directory_from_stage(
@@ -3,7 +3,10 @@ import os
 import shutil
 import sys
 import tempfile
+import pathlib
+import zipfile
 from datetime import datetime
+from unittest import mock
 
 from absl.testing import absltest
 
@@ -56,6 +59,40 @@ class FileUtilsTest(absltest.TestCase):
                 sorted(["model.zip", "model.tar", "model.tar.gz", "model.tar.bz2", "model.tar.xz"]),
             )
 
+    def test_make_zip_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as workspace:
+            fake_mod_dirpath = os.path.join(tmpdir, "snowflake", "fake", "fake_module")
+            os.makedirs(fake_mod_dirpath)
+            os.makedirs(os.path.join(tmpdir, "empty"))
+
+            py_file_path = os.path.join(fake_mod_dirpath, "p.py")
+            with open(py_file_path, "w", encoding="utf-8") as f:
+                f.write(PY_SRC)
+
+            file_utils.make_archive(os.path.join(workspace, "expected.zip"), tmpdir)
+            file_utils.make_zip_archive(
+                os.path.join(workspace, "model.zip"), tmpdir, copy_dir=os.path.join(workspace, "model")
+            )
+
+            with zipfile.ZipFile(os.path.join(workspace, "expected.zip")) as expected_zf, zipfile.ZipFile(
+                os.path.join(workspace, "model.zip")
+            ) as zf:
+                self.assertListEqual(expected_zf.namelist(), zf.namelist())
+                self.assertEqual(PY_SRC, zf.read("snowflake/fake/fake_module/p.py").decode("utf-8"))
+
+            file_utils.make_zip_archive(os.path.join(workspace, "stored.zip"), tmpdir, compression=zipfile.ZIP_STORED)
+            with zipfile.ZipFile(os.path.join(workspace, "stored.zip")) as zf:
+                self.assertTrue(all(zi.compress_type == zipfile.ZIP_STORED for zi in zf.infolist()))
+                self.assertEqual(PY_SRC, zf.read("snowflake/fake/fake_module/p.py").decode("utf-8"))
+
+            self.assertListEqual(
+                [ele[1:] for ele in os.walk(tmpdir)],
+                [ele[1:] for ele in os.walk(os.path.join(workspace, "model"))],
+            )
+            copied_py_file_path = os.path.join(workspace, "model", "snowflake", "fake", "fake_module", "p.py")
+            with open(copied_py_file_path, encoding="utf-8") as f:
+                self.assertEqual(PY_SRC, f.read())
+
     def test_zip_python_package(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             fake_mod_dirpath = os.path.join(tmpdir, "snowflake", "fake", "fake_module")
@@ -207,6 +244,56 @@ class FileUtilsTest(absltest.TestCase):
         self.assertTrue(file_utils._able_ascii_encode("abc"))
         self.assertFalse(file_utils._able_ascii_encode("❄️"))
 
+    def test_upload_directory_to_stage(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, "model", "code"))
+            for rel_path in [("MANIFEST.yml",), ("model", "model.yaml"), ("model", "code", "a.py")]:
+                with open(os.path.join(tmpdir, *rel_path), "w", encoding="utf-8") as f:
+                    f.write(PY_SRC)
+            expected_calls = [
+                mock.call(
+                    os.path.join(tmpdir, "MANIFEST.yml"),
+                    "@db.schema.stage/v1",
+                    auto_compress=False,
+                    overwrite=False,
+                    statement_params={"test": "1"},
+                ),
+                mock.call(
+                    os.path.join(tmpdir, "model", "model.yaml"),
+                    "@db.schema.stage/v1/model",
+                    auto_compress=False,
+                    overwrite=False,
+                    statement_params={"test": "1"},
+                ),
+                mock.call(
+                    os.path.join(tmpdir, "model", "code", "a.py"),
+                    "@db.schema.stage/v1/model/code",
+                    auto_compress=False,
+                    overwrite=False,
+                    statement_params={"test": "1"},
+                ),
+            ]
+
+            for max_workers, in_sproc in [(None, False), (1, False), (None, True)]:
+                with mock.patch.object(file_utils.snowpark, "FileOperation") as mock_file_operation, mock.patch.object(
+                    file_utils.snowpark_utils, "is_in_stored_procedure", return_value=in_sproc
+                ), mock.patch.object(
+                    file_utils.futures, "ThreadPoolExecutor", wraps=file_utils.futures.ThreadPoolExecutor
+                ) as mock_executor:
+                    file_utils.upload_directory_to_stage(
+                        mock.MagicMock(),
+                        pathlib.Path(tmpdir),
+                        pathlib.PurePosixPath("@db.schema.stage/v1"),
+                        statement_params={"test": "1"},
+                        max_workers=max_workers,
+                    )
+                    # Every file is put exactly once, into the stage directory mirroring its local directory.
+                    self.assertCountEqual(expected_calls, mock_file_operation.return_value.put.call_args_list)
+                    if max_workers == 1 or in_sproc:
+                        mock_executor.assert_not_called()
+                    else:
+                        mock_executor.assert_called_once()
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -139,8 +139,9 @@ def get_statement_params_full_func_name(frame: Optional[types.FrameType], class_
         >>> func_name = get_statement_params_full_func_name(inspect.currentframe(), "ClassName")
         >>> statement_params = get_function_usage_statement_params(function_name=func_name, ...)
     """
-    module = inspect.getmodule(frame)
-    module_name = module.__name__ if module else None
+    # The module name is read from the frame globals, which is what inspect.getmodule resolves to for a frame, without
+    # its file path lookups on every call.
+    module_name = frame.f_globals.get("__name__") if frame else None
     function_name = frame.f_code.co_name if frame else None
     func_name = ".".join([name for name in [module_name, class_name, function_name] if name])
     return func_name
@@ -302,6 +303,8 @@ def send_api_usage_telemetry(
     """
 
     def decorator(func: Callable[_Args, _ReturnValue]) -> Callable[_Args, _ReturnValue]:
+        func_name = _get_full_func_name(func)
+
         @functools.wraps(func)
         def wrap(*args: Any, **kwargs: Any) -> _ReturnValue:
             params = _get_func_params(func, func_params_to_log, args, kwargs) if func_params_to_log else None
@@ -316,7 +319,7 @@ def send_api_usage_telemetry(
                         api_calls.append({TelemetryField.NAME.value: _get_full_func_name(api_call)})
                     else:
                         api_calls.append(api_call)
-            api_calls.append({TelemetryField.NAME.value: _get_full_func_name(func)})
+            api_calls.append({TelemetryField.NAME.value: func_name})
 
             sfqids = None
             if sfqids_extractor:
@@ -326,7 +329,7 @@ def send_api_usage_telemetry(
                 project=project,
                 subproject=subproject,
                 function_category=TelemetryField.FUNC_CAT_USAGE.value,
-                function_name=_get_full_func_name(func),
+                function_name=func_name,
                 function_parameters=params,
                 api_calls=api_calls,
                 custom_tags=custom_tags,
@@ -383,7 +386,7 @@ def send_api_usage_telemetry(
             # TODO(hayu): [SNOW-750287] Optimize telemetry client to a singleton.
             telemetry = _SourceTelemetryClient(conn=conn, project=project, subproject=subproject)
             telemetry_args = dict(
-                func_name=_get_full_func_name(func),
+                func_name=func_name,
                 function_category=TelemetryField.FUNC_CAT_USAGE.value,
                 func_params=params,
                 api_calls=api_calls,
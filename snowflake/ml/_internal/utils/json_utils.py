@@ -0,0 +1,57 @@
+"""JSON helpers which use orjson when it is installed and fall back to the standard library otherwise.
+
+orjson is considerably faster on both directions for the small dict/str payloads passed around in this package, but
+it is not a hard dependency. The helpers produce compact output in both modes.
+"""
+
+import json
+from typing import Any
+
+from snowflake.ml._internal.utils import import_utils
+
+orjson, _ORJSON_AVAILABLE = import_utils.import_or_get_dummy("orjson")
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so callers can always catch the latter.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: The object to serialize. Dict keys must be strings.
+
+    Returns:
+        The compact JSON document as bytes.
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj)  # type: ignore[no-any-return]
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: The object to serialize. Dict keys must be strings.
+
+    Returns:
+        The compact JSON document as str.
+    """
+    return dumps(obj).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: The JSON document as str, bytes, bytearray or memoryview.
+
+    Returns:
+        The deserialized object.
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
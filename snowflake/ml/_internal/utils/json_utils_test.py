@@ -0,0 +1,29 @@
+import json
+from unittest import mock
+
+from absl.testing import absltest, parameterized
+
+from snowflake.ml._internal.utils import json_utils
+
+
+class JsonUtilsTest(parameterized.TestCase):
+    @parameterized.parameters(True, False)  # type: ignore[misc]
+    def test_round_trip(self, orjson_available: bool) -> None:
+        obj = {"a": 1, "b": [1.5, "c", None, True], "d": {"e": "é"}}
+        with mock.patch.object(json_utils, "_ORJSON_AVAILABLE", orjson_available and json_utils._ORJSON_AVAILABLE):
+            dumped = json_utils.dumps(obj)
+            self.assertIsInstance(dumped, bytes)
+            self.assertEqual(obj, json.loads(dumped))
+            self.assertEqual(obj, json_utils.loads(dumped))
+            self.assertEqual(obj, json_utils.loads(json_utils.dumps_str(obj)))
+            self.assertEqual(obj, json_utils.loads(memoryview(dumped)))
+
+    @parameterized.parameters(True, False)  # type: ignore[misc]
+    def test_decode_error(self, orjson_available: bool) -> None:
+        with mock.patch.object(json_utils, "_ORJSON_AVAILABLE", orjson_available and json_utils._ORJSON_AVAILABLE):
+            with self.assertRaises(json_utils.JSONDecodeError):
+                json_utils.loads("{")
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -79,9 +79,12 @@ def cast_snowpark_dataframe_column_types(df: snowpark.DataFrame) -> snowpark.Dat
         df: A snowpark dataframe.
 
     Returns:
-        A snowpark dataframe whose data type has been casted.
+        A snowpark dataframe whose data type has been casted. The input dataframe is returned as is when no column
+        needs a cast.
     """
     fields = df.schema.fields
+    if not any(isinstance(field.datatype, types.DecimalType) for field in fields):
+        return df
     selected_cols = []
     for field in fields:
         src = field.column_identifier.quoted_name
@@ -1,3 +1,4 @@
+import functools
 from typing import List, Optional, Tuple
 
 from snowflake.ml._internal.utils import identifier
@@ -77,6 +78,26 @@ class SqlIdentifier(str):
         return super().__hash__()
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_sql_identifier(name: str, case_sensitive: bool) -> SqlIdentifier:
+    return SqlIdentifier(name, case_sensitive=case_sensitive)
+
+
+def cached_sql_identifier(name: str, *, case_sensitive: bool = False) -> SqlIdentifier:
+    """Get a SqlIdentifier, reusing the instance created for the same input. SqlIdentifier is immutable, so the
+        instance can be shared, which avoids parsing names repeatedly used on hot paths.
+
+    Args:
+        name: A string name.
+        case_sensitive: Same as in SqlIdentifier. Defaults to False.
+
+    Returns:
+        The SqlIdentifier of the name.
+    """
+    # Key the cache on the plain string, as SqlIdentifier equality is based on resolved names rather than strings.
+    return _cached_sql_identifier(str(name), case_sensitive)
+
+
 def to_sql_identifiers(list_of_str: List[str], *, case_sensitive: bool = False) -> List[SqlIdentifier]:
     return [SqlIdentifier(val, case_sensitive=case_sensitive) for val in list_of_str]
 
@@ -42,6 +42,19 @@ class SqlIdentifierTest(absltest.TestCase):
         id_2 = sql_identifier.SqlIdentifier("abc", case_sensitive=True)
         self.assertNotEqual(id_1, id_2)
 
+    def test_cached_sql_identifier(self) -> None:
+        id_1 = sql_identifier.cached_sql_identifier("abc")
+        self.assertEqual(id_1, sql_identifier.SqlIdentifier("abc"))
+        self.assertEqual(id_1.identifier(), "ABC")
+        self.assertIs(id_1, sql_identifier.cached_sql_identifier("abc"))
+
+        id_2 = sql_identifier.cached_sql_identifier("abc", case_sensitive=True)
+        self.assertEqual(id_2.identifier(), '"abc"')
+        self.assertIsNot(id_1, id_2)
+
+        id_3 = sql_identifier.cached_sql_identifier(sql_identifier.SqlIdentifier('"ABC"'))
+        self.assertEqual(id_3.identifier(), '"ABC"')
+
     def test_parse_fully_qualified_name(self) -> None:
         self.assertTupleEqual(
             sql_identifier.parse_fully_qualified_name("abc"), (None, None, sql_identifier.SqlIdentifier("abc"))
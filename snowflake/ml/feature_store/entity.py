@@ -22,6 +22,8 @@ class Entity:
     It can also be used for FeatureView search and lineage tracking.
     """
 
+    __slots__ = ("name", "join_keys", "owner", "desc")
+
     def __init__(self, name: str, join_keys: List[str], desc: str = "") -> None:
         """
         Creates an Entity instance.
@@ -47,9 +49,11 @@ class Entity:
             raise ValueError(
                 f"Maximum number of join keys are {_ENTITY_MAX_NUM_JOIN_KEYS}, " "but {len(join_keys)} is provided."
             )
-        if len(set(join_keys)) != len(join_keys):
-            raise ValueError(f"Duplicate join keys detected in: {join_keys}")
+        seen = set()
         for k in join_keys:
+            if k in seen:
+                raise ValueError(f"Duplicate join keys detected in: {join_keys}")
+            seen.add(k)
             # TODO(wezhou) move this logic into SqlIdentifier.
             if _ENTITY_JOIN_KEY_DELIMITER in k:
                 raise ValueError(f"Invalid char `{_ENTITY_JOIN_KEY_DELIMITER}` detected in join key {k}")
@@ -57,10 +61,10 @@ class Entity:
                 raise ValueError(f"Join key: {k} exceeds length limit {_ENTITY_JOIN_KEY_LENGTH_LIMIT}.")
 
     def _to_dict(self) -> Dict[str, str]:
-        entity_dict = self.__dict__.copy()
-        for k, v in entity_dict.items():
-            if isinstance(v, SqlIdentifier):
-                entity_dict[k] = str(v)
+        entity_dict = {}
+        for k in self.__slots__:
+            v = getattr(self, k)
+            entity_dict[k] = str(v) if isinstance(v, SqlIdentifier) else v
         return entity_dict
 
     @staticmethod
@@ -70,7 +74,7 @@ class Entity:
         return e
 
     def __repr__(self) -> str:
-        states = (f"{k}={v}" for k, v in vars(self).items())
+        states = (f"{k}={getattr(self, k)}" for k in self.__slots__)
         return f"{type(self).__name__}({', '.join(states)})"
 
     def __eq__(self, other: object) -> bool:
@@ -3,8 +3,7 @@ from __future__ import annotations
 import json
 import re
 import warnings
-from collections import OrderedDict
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -12,7 +11,7 @@ from snowflake.ml._internal.exceptions import (
     error_codes,
     exceptions as snowml_exceptions,
 )
-from snowflake.ml._internal.utils import identifier
+from snowflake.ml._internal.utils import identifier, json_utils
 from snowflake.ml._internal.utils.identifier import concat_names
 from snowflake.ml._internal.utils.sql_identifier import (
     SqlIdentifier,
@@ -85,13 +84,24 @@ class FeatureViewStatus(Enum):
 
 @dataclass(frozen=True)
 class FeatureViewSlice:
+    # dataclass(slots=True) requires Python 3.10.
+    __slots__ = ("feature_view_ref", "names")
+
     feature_view_ref: FeatureView
     names: List[SqlIdentifier]
 
     def __repr__(self) -> str:
-        states = (f"{k}={v}" for k, v in vars(self).items())
+        states = (f"{f.name}={getattr(self, f.name)}" for f in fields(self))
         return f"{type(self).__name__}({', '.join(states)})"
 
+    # Frozen dataclasses with slots cannot be unpickled through the default __setattr__.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for k, v in state.items():
+            object.__setattr__(self, k, v)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FeatureViewSlice):
             return False
@@ -104,11 +114,11 @@ class FeatureViewSlice:
             "names": self.names,
             _FEATURE_OBJ_TYPE: self.__class__.__name__,
         }
-        return json.dumps(fvs_dict)
+        return json_utils.dumps_str(fvs_dict)
 
     @classmethod
     def from_json(cls, json_str: str, session: Session) -> FeatureViewSlice:
-        json_dict = json.loads(json_str)
+        json_dict = json_utils.loads(json_str)
         if _FEATURE_OBJ_TYPE not in json_dict or json_dict[_FEATURE_OBJ_TYPE] != cls.__name__:
             raise ValueError(f"Invalid json str for {cls.__name__}: {json_str}")
         del json_dict[_FEATURE_OBJ_TYPE]
@@ -121,6 +131,26 @@ class FeatureView(lineage_node.LineageNode):
     A FeatureView instance encapsulates a logical group of features.
     """
 
+    __slots__ = (
+        "_name",
+        "_entities",
+        "_feature_df",
+        "_timestamp_col",
+        "_desc",
+        "_infer_schema_df",
+        "_query",
+        "_version",
+        "_status",
+        "_feature_desc",
+        "_refresh_freq",
+        "_database",
+        "_schema",
+        "_warehouse",
+        "_refresh_mode",
+        "_refresh_mode_reason",
+        "_owner",
+    )
+
     def __init__(
         self,
         name: str,
@@ -163,7 +193,9 @@ class FeatureView(lineage_node.LineageNode):
         self._query: str = self._get_query()
         self._version: Optional[FeatureViewVersion] = None
         self._status: FeatureViewStatus = FeatureViewStatus.DRAFT
-        self._feature_desc: OrderedDict[SqlIdentifier, str] = OrderedDict((f, "") for f in self._get_feature_names())
+        # Resolving the columns requires the dataframe schema, so do it once for both validation and feature names.
+        df_cols = to_sql_identifiers(self._infer_schema_df.columns)
+        self._feature_desc: Dict[SqlIdentifier, str] = {f: "" for f in self._get_feature_names(df_cols)}
         self._refresh_freq: Optional[str] = refresh_freq
         self._database: Optional[SqlIdentifier] = None
         self._schema: Optional[SqlIdentifier] = None
@@ -171,7 +203,7 @@ class FeatureView(lineage_node.LineageNode):
         self._refresh_mode: Optional[str] = None
         self._refresh_mode_reason: Optional[str] = None
         self._owner: Optional[str] = None
-        self._validate()
+        self._validate(df_cols)
 
     def slice(self, names: List[str]) -> FeatureViewSlice:
         """
@@ -340,33 +372,34 @@ class FeatureView(lineage_node.LineageNode):
         return _FeatureViewMetadata(entity_names, ts_col)
 
     def _get_query(self) -> str:
-        if len(self._feature_df.queries["queries"]) != 1:
+        # DataFrame.queries compiles the query plan on every access.
+        queries = self._feature_df.queries["queries"]
+        if len(queries) != 1:
             raise ValueError(
                 f"""feature_df dataframe must contain only 1 query.
-Got {len(self._feature_df.queries['queries'])}: {self._feature_df.queries['queries']}
+Got {len(queries)}: {queries}
 """
             )
-        return str(self._feature_df.queries["queries"][0])
+        return str(queries[0])
 
-    def _validate(self) -> None:
+    def _validate(self, df_cols: List[SqlIdentifier]) -> None:
         if _FEATURE_VIEW_NAME_DELIMITER in self._name:
             raise ValueError(
                 f"FeatureView name `{self._name}` contains invalid character `{_FEATURE_VIEW_NAME_DELIMITER}`."
             )
 
-        unescaped_df_cols = to_sql_identifiers(self._infer_schema_df.columns)
+        # Compare resolved names through a set, instead of resolving both sides on every SqlIdentifier comparison.
+        resolved_df_cols = frozenset(c.resolved() for c in df_cols)
         for e in self._entities:
             for k in e.join_keys:
-                if k not in unescaped_df_cols:
-                    raise ValueError(
-                        f"join_key {k} in Entity {e.name} is not found in input dataframe: {unescaped_df_cols}"
-                    )
+                if k.resolved() not in resolved_df_cols:
+                    raise ValueError(f"join_key {k} in Entity {e.name} is not found in input dataframe: {df_cols}")
 
         if self._timestamp_col is not None:
             ts_col = self._timestamp_col
             if ts_col == SqlIdentifier(_TIMESTAMP_COL_PLACEHOLDER):
                 raise ValueError(f"Invalid timestamp_col name, cannot be {_TIMESTAMP_COL_PLACEHOLDER}.")
-            if ts_col not in to_sql_identifiers(self._infer_schema_df.columns):
+            if ts_col.resolved() not in resolved_df_cols:
                 raise ValueError(f"timestamp_col {ts_col} is not found in input dataframe.")
 
             col_type = self._infer_schema_df.schema[ts_col].datatype
@@ -376,23 +409,26 @@ Got {len(self._feature_df.queries['queries'])}: {self._feature_df.queries['queri
         if re.match(_RESULT_SCAN_QUERY_PATTERN, self._query) is not None:
             raise ValueError(f"feature_df should not be reading from RESULT_SCAN. Invalid query: {self._query}")
 
-    def _get_feature_names(self) -> List[SqlIdentifier]:
-        join_keys = [k for e in self._entities for k in e.join_keys]
-        ts_col = [self._timestamp_col] if self._timestamp_col is not None else []
-        feature_names = to_sql_identifiers(self._infer_schema_df.columns, case_sensitive=False)
-        return [c for c in feature_names if c not in join_keys + ts_col]
+    def _get_feature_names(self, df_cols: List[SqlIdentifier]) -> List[SqlIdentifier]:
+        excluded = {k.resolved() for e in self._entities for k in e.join_keys}
+        if self._timestamp_col is not None:
+            excluded.add(self._timestamp_col.resolved())
+        return [c for c in df_cols if c.resolved() not in excluded]
 
     def __repr__(self) -> str:
-        states = (f"{k}={v}" for k, v in vars(self).items())
+        states = (f"{k}={getattr(self, k)}" for k in FeatureView.__slots__)
         return f"{type(self).__name__}({', '.join(states)})"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FeatureView):
             return False
 
+        # Versions are plain strings, so compare them before resolving any identifiers.
         return (
-            self.name == other.name
-            and self.version == other.version
+            self.version == other.version
+            and self.name == other.name
             and self.timestamp_col == other.timestamp_col
             and self.entities == other.entities
             and self.desc == other.desc
@@ -408,37 +444,33 @@ Got {len(self._feature_df.queries['queries'])}: {self._feature_df.queries['queri
             and self._owner == other._owner
         )
 
-    def _to_dict(self) -> Dict[str, str]:
-        fv_dict = self.__dict__.copy()
-        if "_feature_df" in fv_dict:
-            fv_dict.pop("_feature_df")
-        if "_infer_schema_df" in fv_dict:
-            infer_schema_df = fv_dict.pop("_infer_schema_df")
-            fv_dict["_infer_schema_query"] = infer_schema_df.queries["queries"][0]
-        fv_dict["_entities"] = [e._to_dict() for e in self._entities]
-        fv_dict["_status"] = str(self._status)
-        fv_dict["_name"] = str(self._name) if self._name is not None else None
-        fv_dict["_version"] = str(self._version) if self._version is not None else None
-        fv_dict["_database"] = str(self._database) if self._database is not None else None
-        fv_dict["_schema"] = str(self._schema) if self._schema is not None else None
-        fv_dict["_warehouse"] = str(self._warehouse) if self._warehouse is not None else None
-        fv_dict["_timestamp_col"] = str(self._timestamp_col) if self._timestamp_col is not None else None
-
-        feature_desc_dict = {}
-        for k, v in self._feature_desc.items():
-            feature_desc_dict[k.identifier()] = v
-        fv_dict["_feature_desc"] = feature_desc_dict
-
-        lineage_node_keys = [key for key in fv_dict if key.startswith("_node") or key == "_session"]
-
-        for key in lineage_node_keys:
-            fv_dict.pop(key)
-
-        return fv_dict
+    def __hash__(self) -> int:
+        return hash((self._name.resolved(), self._version))
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "_name": str(self._name) if self._name is not None else None,
+            "_entities": [e._to_dict() for e in self._entities],
+            "_timestamp_col": str(self._timestamp_col) if self._timestamp_col is not None else None,
+            "_desc": self._desc,
+            "_query": self._query,
+            "_version": str(self._version) if self._version is not None else None,
+            "_status": str(self._status),
+            "_feature_desc": {k.identifier(): v for k, v in self._feature_desc.items()},
+            "_refresh_freq": self._refresh_freq,
+            "_database": str(self._database) if self._database is not None else None,
+            "_schema": str(self._schema) if self._schema is not None else None,
+            "_warehouse": str(self._warehouse) if self._warehouse is not None else None,
+            "_refresh_mode": self._refresh_mode,
+            "_refresh_mode_reason": self._refresh_mode_reason,
+            "_owner": self._owner,
+            "_infer_schema_query": self._infer_schema_df.queries["queries"][0],
+        }
 
     def to_df(self, session: Session) -> DataFrame:
-        values = list(self._to_dict().values())
-        schema = [x.lstrip("_") for x in list(self._to_dict().keys())]
+        fv_dict = self._to_dict()
+        values = list(fv_dict.values())
+        schema = [x.lstrip("_") for x in fv_dict.keys()]
         values.append(str(FeatureView._get_physical_name(self._name, self._version)))  # type: ignore[arg-type]
         schema.append("physical_name")
         return session.create_dataframe([values], schema=schema)
@@ -446,11 +478,11 @@ Got {len(self._feature_df.queries['queries'])}: {self._feature_df.queries['queri
     def to_json(self) -> str:
         state_dict = self._to_dict()
         state_dict[_FEATURE_OBJ_TYPE] = self.__class__.__name__
-        return json.dumps(state_dict)
+        return json_utils.dumps_str(state_dict)
 
     @classmethod
     def from_json(cls, json_str: str, session: Session) -> FeatureView:
-        json_dict = json.loads(json_str)
+        json_dict = json_utils.loads(json_str)
         if _FEATURE_OBJ_TYPE not in json_dict or json_dict[_FEATURE_OBJ_TYPE] != cls.__name__:
             raise ValueError(f"Invalid json str for {cls.__name__}: {json_str}")
 
@@ -20,6 +20,15 @@ class LineageNode:
     Represents a node in a lineage graph and serves as the base class for all machine learning objects.
     """
 
+    __slots__ = (
+        "_lineage_node_name",
+        "_lineage_node_domain",
+        "_lineage_node_version",
+        "_lineage_node_status",
+        "_lineage_node_created_on",
+        "_session",
+    )
+
     def __init__(
         self,
         session: snowpark.Session,
@@ -12,72 +12,72 @@ from snowflake.snowpark import Row, Session
 
 
 class ModelImplTest(absltest.TestCase):
-    def setUp(self) -> None:
-        self.m_session = mock_session.MockSession(conn=None, test_case=self)
-        self.c_session = cast(Session, self.m_session)
-        self.m_model = model_impl.Model._ref(
-            model_ops.ModelOperator(
-                self.c_session,
-                database_name=sql_identifier.SqlIdentifier("TEMP"),
-                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
-            ),
-            model_name=sql_identifier.SqlIdentifier("MODEL"),
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.m_session = mock_session.MockSession(conn=None, test_case=None)
+        cls.c_session = cast(Session, cls.m_session)
+        cls.m_ops = model_ops.ModelOperator(
+            cls.c_session,
+            database_name=sql_identifier.SqlIdentifier("TEMP"),
+            schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
         )
 
+    def setUp(self) -> None:
+        # The model is cheap to reference, and is re-referenced for each test as some tests (e.g. rename) mutate it.
+        self.m_model = model_impl.Model._ref(self.m_ops, model_name=sql_identifier.SqlIdentifier("MODEL"))
+
     def test_property(self) -> None:
         self.assertEqual(self.m_model.name, "MODEL")
         self.assertEqual(self.m_model.fully_qualified_name, 'TEMP."test".MODEL')
 
     def test_version(self) -> None:
-        with mock.patch.object(model_version_impl.ModelVersion, "_get_functions", return_value=[]):
-            m_mv = model_version_impl.ModelVersion._ref(
-                self.m_model._model_ops,
+        m_mv = model_version_impl.ModelVersion._ref(
+            self.m_model._model_ops,
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("V1"),
+        )
+        with mock.patch.object(
+            self.m_model._model_ops, "validate_existence", return_value=True
+        ) as mock_validate_existence, mock.patch.object(
+            self.m_model._model_ops, "get_version_by_alias", return_value=None
+        ) as mock_get_version_by_alias:
+            mv = self.m_model.version("v1")
+            self.assertEqual(mv, m_mv)
+            mock_validate_existence.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
                 version_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=mock.ANY,
+            )
+            mock_get_version_by_alias.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                alias_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=mock.ANY,
             )
-            with mock.patch.object(
-                self.m_model._model_ops, "validate_existence", return_value=True
-            ) as mock_validate_existence, mock.patch.object(
-                self.m_model._model_ops, "get_version_by_alias", return_value=None
-            ) as mock_get_version_by_alias:
-                mv = self.m_model.version("v1")
-                self.assertEqual(mv, m_mv)
-                mock_validate_existence.assert_called_once_with(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=sql_identifier.SqlIdentifier("MODEL"),
-                    version_name=sql_identifier.SqlIdentifier("V1"),
-                    statement_params=mock.ANY,
-                )
-                mock_get_version_by_alias.assert_called_once_with(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=sql_identifier.SqlIdentifier("MODEL"),
-                    alias_name=sql_identifier.SqlIdentifier("V1"),
-                    statement_params=mock.ANY,
-                )
 
     def test_version_with_alias(self) -> None:
-        with mock.patch.object(model_version_impl.ModelVersion, "_get_functions", return_value=[]):
-            m_mv = model_version_impl.ModelVersion._ref(
-                self.m_model._model_ops,
+        m_mv = model_version_impl.ModelVersion._ref(
+            self.m_model._model_ops,
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("V1"),
+        )
+
+        with mock.patch.object(
+            self.m_model._model_ops, "get_version_by_alias", return_value="V1"
+        ) as mock_get_version_by_alias:
+            mv = self.m_model.version("A1")
+            self.assertEqual(mv, m_mv)
+            mock_get_version_by_alias.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
-                version_name=sql_identifier.SqlIdentifier("V1"),
+                alias_name=sql_identifier.SqlIdentifier("A1"),
+                statement_params=mock.ANY,
             )
 
-            with mock.patch.object(
-                self.m_model._model_ops, "get_version_by_alias", return_value="V1"
-            ) as mock_get_version_by_alias:
-                mv = self.m_model.version("A1")
-                self.assertEqual(mv, m_mv)
-                mock_get_version_by_alias.assert_called_once_with(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=sql_identifier.SqlIdentifier("MODEL"),
-                    alias_name=sql_identifier.SqlIdentifier("A1"),
-                    statement_params=mock.ANY,
-                )
-
     def test_version_not_exist(self) -> None:
         with mock.patch.object(
             self.m_model._model_ops, "validate_existence", return_value=False
@@ -97,33 +97,32 @@ class ModelImplTest(absltest.TestCase):
             )
 
     def test_versions(self) -> None:
-        with mock.patch.object(model_version_impl.ModelVersion, "_get_functions", return_value=[]):
-            m_mv_1 = model_version_impl.ModelVersion._ref(
-                self.m_model._model_ops,
-                model_name=sql_identifier.SqlIdentifier("MODEL"),
-                version_name=sql_identifier.SqlIdentifier("V1"),
-            )
-            m_mv_2 = model_version_impl.ModelVersion._ref(
-                self.m_model._model_ops,
+        m_mv_1 = model_version_impl.ModelVersion._ref(
+            self.m_model._model_ops,
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("V1"),
+        )
+        m_mv_2 = model_version_impl.ModelVersion._ref(
+            self.m_model._model_ops,
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+        )
+        with mock.patch.object(
+            self.m_model._model_ops,
+            "list_models_or_versions",
+            return_value=[
+                sql_identifier.SqlIdentifier("V1"),
+                sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+            ],
+        ) as mock_list_models_or_versions:
+            mv_list = self.m_model.versions()
+            self.assertListEqual(mv_list, [m_mv_1, m_mv_2])
+            mock_list_models_or_versions.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
-                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                statement_params=mock.ANY,
             )
-            with mock.patch.object(
-                self.m_model._model_ops,
-                "list_models_or_versions",
-                return_value=[
-                    sql_identifier.SqlIdentifier("V1"),
-                    sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-                ],
-            ) as mock_list_models_or_versions:
-                mv_list = self.m_model.versions()
-                self.assertListEqual(mv_list, [m_mv_1, m_mv_2])
-                mock_list_models_or_versions.assert_called_once_with(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=sql_identifier.SqlIdentifier("MODEL"),
-                    statement_params=mock.ANY,
-                )
 
     def test_show_versions(self) -> None:
         m_list_res = [
@@ -209,11 +208,7 @@ class ModelImplTest(absltest.TestCase):
             return_value=sql_identifier.SqlIdentifier("V1", case_sensitive=True),
         ) as mock_get_default_version, mock.patch.object(
             self.m_model._model_ops, "validate_existence", return_value=True
-        ), mock.patch.object(
-            model_version_impl.ModelVersion, "_get_functions", return_value=[]
-        ), mock.patch.object(
-            self.m_model._model_ops, "get_version_by_alias", return_value=None
-        ):
+        ), mock.patch.object(self.m_model._model_ops, "get_version_by_alias", return_value=None):
             self.assertEqual("V1", self.m_model.default.version_name)
             mock_get_default_version.assert_called_once_with(
                 database_name=None,
@@ -243,9 +238,7 @@ class ModelImplTest(absltest.TestCase):
             self.m_model._model_ops._model_client,
             "show_versions",
             return_value=m_list_res,
-        ), mock.patch.object(self.m_model._model_ops, "validate_existence", return_value=True), mock.patch.object(
-            model_version_impl.ModelVersion, "_get_functions", return_value=[]
-        ):
+        ), mock.patch.object(self.m_model._model_ops, "validate_existence", return_value=True):
             self.assertEqual(self.m_model.first().version_name, '"v1"')
             self.assertEqual(self.m_model.last().version_name, '"v2"')
 
@@ -262,9 +255,7 @@ class ModelImplTest(absltest.TestCase):
 
         with mock.patch.object(
             self.m_model._model_ops, "set_default_version"
-        ) as mock_set_default_version, mock.patch.object(
-            model_version_impl.ModelVersion, "_get_functions", return_value=[]
-        ):
+        ) as mock_set_default_version:
             mv = model_version_impl.ModelVersion._ref(
                 self.m_model._model_ops,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
@@ -1,8 +1,12 @@
 import enum
+import functools
+import os
 import pathlib
+import shutil
 import tempfile
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import pandas as pd
 
@@ -13,13 +17,20 @@ from snowflake.ml.model import type_hints as model_types
 from snowflake.ml.model._client.ops import metadata_ops, model_ops
 from snowflake.ml.model._model_composer import model_composer
 from snowflake.ml.model._model_composer.model_manifest import model_manifest_schema
-from snowflake.ml.model._packager.model_handlers import snowmlmodel
 from snowflake.snowpark import Session, dataframe
 
 _TELEMETRY_PROJECT = "MLOps"
 _TELEMETRY_SUBPROJECT = "ModelManagement"
 
 
+def _is_non_empty_dir(path: pathlib.Path) -> bool:
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+
+
 class ExportMode(enum.Enum):
     MODEL = "model"
     FULL = "full"
@@ -31,7 +42,9 @@ class ModelVersion(lineage_node.LineageNode):
     _model_ops: model_ops.ModelOperator
     _model_name: sql_identifier.SqlIdentifier
     _version_name: sql_identifier.SqlIdentifier
-    _functions: List[model_manifest_schema.ModelFunctionInfo]
+    _fully_qualified_model_name: str
+    _fingerprint: Tuple[str, str, str, str]
+    _meta_cache: Dict[str, Any]
 
     def __init__(self) -> None:
         raise RuntimeError("ModelVersion's initializer is not meant to be used. Use `version` from model instead.")
@@ -48,13 +61,21 @@ class ModelVersion(lineage_node.LineageNode):
         self._model_ops = model_ops
         self._model_name = model_name
         self._version_name = version_name
-        self._functions = self._get_functions()
+        self._fully_qualified_model_name = model_ops._model_version_client.fully_qualified_object_name(
+            database_name=None, schema_name=None, object_name=model_name
+        )
+        # Resolved names identifying the version, as compared by SqlIdentifier and the SQL clients of the operator.
+        self._fingerprint = (
+            model_ops._model_version_client._database_name.resolved(),
+            model_ops._model_version_client._schema_name.resolved(),
+            model_name.resolved(),
+            version_name.resolved(),
+        )
+        self._meta_cache = {}
         super(cls, cls).__init__(
             self,
             session=model_ops._session,
-            name=model_ops._model_client.fully_qualified_object_name(
-                database_name=None, schema_name=None, object_name=model_name
-            ),
+            name=self._fully_qualified_model_name,
             domain="model",
             version=version_name,
         )
@@ -63,11 +84,10 @@ class ModelVersion(lineage_node.LineageNode):
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, ModelVersion):
             return False
-        return (
-            self._model_ops == __value._model_ops
-            and self._model_name == __value._model_name
-            and self._version_name == __value._version_name
-        )
+        return self._fingerprint == __value._fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint)
 
     def __repr__(self) -> str:
         return (
@@ -87,7 +107,7 @@ class ModelVersion(lineage_node.LineageNode):
     @property
     def fully_qualified_model_name(self) -> str:
         """Return the fully qualified name of the model to which the model version belongs."""
-        return self._model_ops._model_version_client.fully_qualified_object_name(None, None, self._model_name)
+        return self._fully_qualified_model_name
 
     @property
     @telemetry.send_api_usage_telemetry(
@@ -113,17 +133,19 @@ class ModelVersion(lineage_node.LineageNode):
     )
     def comment(self) -> str:
         """The comment to the model version."""
-        statement_params = telemetry.get_statement_params(
-            project=_TELEMETRY_PROJECT,
-            subproject=_TELEMETRY_SUBPROJECT,
-        )
-        return self._model_ops.get_comment(
-            database_name=None,
-            schema_name=None,
-            model_name=self._model_name,
-            version_name=self._version_name,
-            statement_params=statement_params,
-        )
+        if "comment" not in self._meta_cache:
+            statement_params = telemetry.get_statement_params(
+                project=_TELEMETRY_PROJECT,
+                subproject=_TELEMETRY_SUBPROJECT,
+            )
+            self._meta_cache["comment"] = self._model_ops.get_comment(
+                database_name=None,
+                schema_name=None,
+                model_name=self._model_name,
+                version_name=self._version_name,
+                statement_params=statement_params,
+            )
+        return cast(str, self._meta_cache["comment"])
 
     @comment.setter
     @telemetry.send_api_usage_telemetry(
@@ -135,7 +157,7 @@ class ModelVersion(lineage_node.LineageNode):
             project=_TELEMETRY_PROJECT,
             subproject=_TELEMETRY_SUBPROJECT,
         )
-        return self._model_ops.set_comment(
+        self._model_ops.set_comment(
             comment=comment,
             database_name=None,
             schema_name=None,
@@ -143,6 +165,7 @@ class ModelVersion(lineage_node.LineageNode):
             version_name=self._version_name,
             statement_params=statement_params,
         )
+        self._meta_cache["comment"] = comment
 
     @telemetry.send_api_usage_telemetry(
         project=_TELEMETRY_PROJECT,
@@ -154,17 +177,19 @@ class ModelVersion(lineage_node.LineageNode):
         Returns:
             A dictionary showing the metrics.
         """
-        statement_params = telemetry.get_statement_params(
-            project=_TELEMETRY_PROJECT,
-            subproject=_TELEMETRY_SUBPROJECT,
-        )
-        return self._model_ops._metadata_ops.load(
-            database_name=None,
-            schema_name=None,
-            model_name=self._model_name,
-            version_name=self._version_name,
-            statement_params=statement_params,
-        )["metrics"]
+        if "metrics" not in self._meta_cache:
+            statement_params = telemetry.get_statement_params(
+                project=_TELEMETRY_PROJECT,
+                subproject=_TELEMETRY_SUBPROJECT,
+            )
+            self._meta_cache["metrics"] = self._model_ops._metadata_ops.load(
+                database_name=None,
+                schema_name=None,
+                model_name=self._model_name,
+                version_name=self._version_name,
+                statement_params=statement_params,
+            )["metrics"]
+        return dict(self._meta_cache["metrics"])
 
     @telemetry.send_api_usage_telemetry(
         project=_TELEMETRY_PROJECT,
@@ -202,16 +227,11 @@ class ModelVersion(lineage_node.LineageNode):
             project=_TELEMETRY_PROJECT,
             subproject=_TELEMETRY_SUBPROJECT,
         )
-        metrics = self.show_metrics()
-        metrics[metric_name] = value
-        self._model_ops._metadata_ops.save(
-            metadata_ops.ModelVersionMetadataSchema(metrics=metrics),
-            database_name=None,
-            schema_name=None,
-            model_name=self._model_name,
-            version_name=self._version_name,
-            statement_params=statement_params,
-        )
+
+        def _set(metrics: Dict[str, Any]) -> None:
+            metrics[metric_name] = value
+
+        self._update_metrics(_set, statement_params=statement_params)
 
     @telemetry.send_api_usage_telemetry(
         project=_TELEMETRY_PROJECT,
@@ -227,7 +247,7 @@ class ModelVersion(lineage_node.LineageNode):
             project=_TELEMETRY_PROJECT,
             subproject=_TELEMETRY_SUBPROJECT,
         )
-        alias_name = sql_identifier.SqlIdentifier(alias_name)
+        alias_name = sql_identifier.cached_sql_identifier(alias_name)
         self._model_ops.set_alias(
             alias_name=alias_name,
             database_name=None,
@@ -276,18 +296,58 @@ class ModelVersion(lineage_node.LineageNode):
             project=_TELEMETRY_PROJECT,
             subproject=_TELEMETRY_SUBPROJECT,
         )
-        metrics = self.show_metrics()
-        if metric_name not in metrics:
-            raise KeyError(f"Cannot find metric with name {metric_name}.")
-        del metrics[metric_name]
-        self._model_ops._metadata_ops.save(
-            metadata_ops.ModelVersionMetadataSchema(metrics=metrics),
+
+        def _delete(metrics: Dict[str, Any]) -> None:
+            if metric_name not in metrics:
+                raise KeyError(f"Cannot find metric with name {metric_name}.")
+            del metrics[metric_name]
+
+        self._update_metrics(_delete, statement_params=statement_params)
+
+    def _update_metrics(
+        self,
+        mutate: Callable[[Dict[str, Any]], None],
+        *,
+        statement_params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        metrics: Dict[str, Any] = {}
+
+        def _updater(metadata: metadata_ops.ModelVersionMetadataSchema) -> metadata_ops.ModelVersionMetadataSchema:
+            metrics.update(metadata.get("metrics", {}))
+            mutate(metrics)
+            return metadata_ops.ModelVersionMetadataSchema(metrics=metrics)
+
+        self._meta_cache.pop("metrics", None)
+        self._model_ops._metadata_ops.update(
+            _updater,
             database_name=None,
             schema_name=None,
             model_name=self._model_name,
             version_name=self._version_name,
             statement_params=statement_params,
         )
+        self._meta_cache["metrics"] = dict(metrics)
+
+    @telemetry.send_api_usage_telemetry(
+        project=_TELEMETRY_PROJECT,
+        subproject=_TELEMETRY_SUBPROJECT,
+    )
+    def invalidate(self) -> None:
+        """Invalidate the comment and metrics cached in the model version object.
+
+        They are fetched again on the next read. Use it when the model version might have been modified elsewhere, for
+        example through SQL or through another model version object.
+        """
+        self._meta_cache.clear()
+
+    @functools.cached_property
+    def _functions(self) -> List[model_manifest_schema.ModelFunctionInfo]:
+        # Fetched on first use only, so that referencing a version for its metadata does not cost a query.
+        return self._get_functions()
+
+    @functools.cached_property
+    def _functions_by_name(self) -> Dict[str, model_manifest_schema.ModelFunctionInfo]:
+        return {function_info["name"]: function_info for function_info in self._functions}
 
     def _get_functions(self) -> List[model_manifest_schema.ModelFunctionInfo]:
         statement_params = telemetry.get_statement_params(
@@ -359,14 +419,8 @@ class ModelVersion(lineage_node.LineageNode):
 
         functions: List[model_manifest_schema.ModelFunctionInfo] = self._functions
         if function_name:
-            req_method_name = sql_identifier.SqlIdentifier(function_name).identifier()
-            find_method: Callable[[model_manifest_schema.ModelFunctionInfo], bool] = (
-                lambda method: method["name"] == req_method_name
-            )
-            target_function_info = next(
-                filter(find_method, functions),
-                None,
-            )
+            req_method_name = sql_identifier.cached_sql_identifier(function_name).identifier()
+            target_function_info = self._functions_by_name.get(req_method_name)
             if target_function_info is None:
                 raise ValueError(
                     f"There is no method with name {function_name} available in the model"
@@ -380,7 +434,7 @@ class ModelVersion(lineage_node.LineageNode):
         else:
             target_function_info = functions[0]
         return self._model_ops.invoke_method(
-            method_name=sql_identifier.SqlIdentifier(target_function_info["name"]),
+            method_name=sql_identifier.cached_sql_identifier(target_function_info["name"]),
             method_function_type=target_function_info["target_method_function_type"],
             signature=target_function_info["signature"],
             X=X,
@@ -409,7 +463,7 @@ class ModelVersion(lineage_node.LineageNode):
             ValueError: Raised when the target path is a file or an non-empty folder.
         """
         target_local_path = pathlib.Path(target_path)
-        if target_local_path.is_file() or any(target_local_path.iterdir()):
+        if target_local_path.is_file() or _is_non_empty_dir(target_local_path):
             raise ValueError(f"Target path {target_local_path} is a file or an non-empty folder.")
 
         target_local_path.mkdir(parents=False, exist_ok=True)
@@ -455,37 +509,40 @@ class ModelVersion(lineage_node.LineageNode):
             project=_TELEMETRY_PROJECT,
             subproject=_TELEMETRY_SUBPROJECT,
         )
+        # We need the folder to be existed.
+        workspace = pathlib.Path(tempfile.mkdtemp())
+        # The model directory contains the files needed for validation, so it is downloaded once for both.
+        self._model_ops.download_files(
+            database_name=None,
+            schema_name=None,
+            model_name=self._model_name,
+            version_name=self._version_name,
+            target_path=workspace,
+            mode="model",
+            statement_params=statement_params,
+        )
         if not force:
-            with tempfile.TemporaryDirectory() as tmp_workspace_for_validation:
-                ws_path_for_validation = pathlib.Path(tmp_workspace_for_validation)
-                self._model_ops.download_files(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=self._model_name,
-                    version_name=self._version_name,
-                    target_path=ws_path_for_validation,
-                    mode="minimal",
-                    statement_params=statement_params,
-                )
-                pk_for_validation = model_composer.ModelComposer.load(
-                    ws_path_for_validation, meta_only=True, options=options
-                )
-                assert pk_for_validation.meta, (
-                    "Unable to load model metadata for validation. "
-                    f"model_name={self._model_name}, version_name={self._version_name}"
-                )
+            # Only needed for validation, so loading with force=True does not import the handler.
+            from snowflake.ml.model._packager.model_handlers import snowmlmodel
 
-                validation_errors = pk_for_validation.meta.env.validate_with_local_env(
-                    check_snowpark_ml_version=(
-                        pk_for_validation.meta.model_type == snowmlmodel.SnowMLModelHandler.HANDLER_TYPE
-                    )
+            pk_for_validation = model_composer.ModelComposer.load(workspace, meta_only=True, options=options)
+            assert pk_for_validation.meta, (
+                "Unable to load model metadata for validation. "
+                f"model_name={self._model_name}, version_name={self._version_name}"
+            )
+
+            validation_errors = pk_for_validation.meta.env.validate_with_local_env(
+                check_snowpark_ml_version=(
+                    pk_for_validation.meta.model_type == snowmlmodel.SnowMLModelHandler.HANDLER_TYPE
+                )
+            )
+            if validation_errors:
+                shutil.rmtree(workspace, ignore_errors=True)
+                raise ValueError(
+                    f"Unable to load this model due to following validation errors: {validation_errors}. "
+                    "Make sure your local environment is the same as that when you logged the model, "
+                    "or if you believe it should work, specify `force=True` to bypass this check."
                 )
-                if validation_errors:
-                    raise ValueError(
-                        f"Unable to load this model due to following validation errors: {validation_errors}. "
-                        "Make sure your local environment is the same as that when you logged the model, "
-                        "or if you believe it should work, specify `force=True` to bypass this check."
-                    )
 
         warnings.warn(
             "Loading model requires to have the exact the same environment as the one when "
@@ -495,22 +552,17 @@ class ModelVersion(lineage_node.LineageNode):
             stacklevel=2,
         )
 
-        # We need the folder to be existed.
-        workspace = pathlib.Path(tempfile.mkdtemp())
-        self._model_ops.download_files(
-            database_name=None,
-            schema_name=None,
-            model_name=self._model_name,
-            version_name=self._version_name,
-            target_path=workspace,
-            mode="model",
-            statement_params=statement_params,
-        )
         pk = model_composer.ModelComposer.load(workspace, meta_only=False, options=options)
         assert pk.model, (
             "Unable to load model. "
             f"model_name={self._model_name}, version_name={self._version_name}, metadata={pk.meta}"
         )
+        # Some models keep reading files from the workspace (e.g. artifacts of a custom model), so it is removed when
+        # the model is garbage collected rather than now.
+        try:
+            weakref.finalize(pk.model, shutil.rmtree, workspace, ignore_errors=True)
+        except TypeError:  # The model cannot be weakly referenced, keep the workspace.
+            pass
         return pk.model
 
     @staticmethod
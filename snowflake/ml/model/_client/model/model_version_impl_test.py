@@ -1,5 +1,6 @@
 import os
 import pathlib
+import shutil
 import tempfile
 from typing import cast
 from unittest import mock
@@ -35,16 +36,15 @@ class ModelVersionImplTest(absltest.TestCase):
     def setUp(self) -> None:
         self.m_session = mock_session.MockSession(conn=None, test_case=self)
         self.c_session = cast(Session, self.m_session)
-        with mock.patch.object(model_version_impl.ModelVersion, "_get_functions", return_value=[]):
-            self.m_mv = model_version_impl.ModelVersion._ref(
-                model_ops.ModelOperator(
-                    self.c_session,
-                    database_name=sql_identifier.SqlIdentifier("TEMP"),
-                    schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
-                ),
-                model_name=sql_identifier.SqlIdentifier("MODEL"),
-                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-            )
+        self.m_mv = model_version_impl.ModelVersion._ref(
+            model_ops.ModelOperator(
+                self.c_session,
+                database_name=sql_identifier.SqlIdentifier("TEMP"),
+                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+            ),
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+        )
 
     def test_ref(self) -> None:
         with mock.patch.object(model_version_impl.ModelVersion, "_get_functions", return_value=[]) as mock_list_methods:
@@ -57,13 +57,33 @@ class ModelVersionImplTest(absltest.TestCase):
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
                 version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
             )
-            mock_list_methods.assert_called_once_with()
+            mock_list_methods.assert_not_called()
 
     def test_property(self) -> None:
         self.assertEqual(self.m_mv.model_name, "MODEL")
         self.assertEqual(self.m_mv.fully_qualified_model_name, 'TEMP."test".MODEL')
         self.assertEqual(self.m_mv.version_name, '"v1"')
 
+    def test_eq_and_hash(self) -> None:
+        m_mv_same = model_version_impl.ModelVersion._ref(
+            model_ops.ModelOperator(
+                self.c_session,
+                database_name=sql_identifier.SqlIdentifier('"TEMP"'),
+                schema_name=sql_identifier.SqlIdentifier('"test"'),
+            ),
+            model_name=sql_identifier.SqlIdentifier("model"),
+            version_name=sql_identifier.SqlIdentifier('"v1"'),
+        )
+        m_mv_other = model_version_impl.ModelVersion._ref(
+            self.m_mv._model_ops,
+            model_name=sql_identifier.SqlIdentifier("MODEL"),
+            version_name=sql_identifier.SqlIdentifier("V1"),
+        )
+        self.assertEqual(self.m_mv, m_mv_same)
+        self.assertNotEqual(self.m_mv, m_mv_other)
+        self.assertEqual(hash(self.m_mv), hash(m_mv_same))
+        self.assertEqual(2, len({self.m_mv, m_mv_same, m_mv_other}))
+
     def test_show_metrics(self) -> None:
         m_metadata = metadata_ops.ModelVersionMetadataSchema(metrics={})
         with mock.patch.object(self.m_mv._model_ops._metadata_ops, "load", return_value=m_metadata) as mock_load:
@@ -102,20 +122,22 @@ class ModelVersionImplTest(absltest.TestCase):
                 )
 
     def test_set_metric_1(self) -> None:
-        m_metadata = metadata_ops.ModelVersionMetadataSchema(metrics={"a": 1})
+        m_meta = {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 1}}
         with mock.patch.object(
-            self.m_mv._model_ops._metadata_ops, "load", return_value=m_metadata
-        ) as mock_load, mock.patch.object(self.m_mv._model_ops._metadata_ops, "save") as mock_save:
+            self.m_mv._model_ops._metadata_ops, "_get_current_metadata_dict", return_value=m_meta
+        ) as mock_get_current_metadata_dict, mock.patch.object(
+            self.m_mv._model_ops._metadata_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
             self.m_mv.set_metric("a", 2)
-            mock_load.assert_called_once_with(
+            mock_get_current_metadata_dict.assert_called_once_with(
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
                 version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
                 statement_params=mock.ANY,
             )
-            mock_save.assert_called_once_with(
-                metadata_ops.ModelVersionMetadataSchema(metrics={"a": 2}),
+            mock_set_metadata.assert_called_once_with(
+                {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 2}},
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
@@ -124,20 +146,25 @@ class ModelVersionImplTest(absltest.TestCase):
             )
 
     def test_set_metric_2(self) -> None:
-        m_metadata = metadata_ops.ModelVersionMetadataSchema(metrics={"a": 1})
+        m_meta = {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 1}}
         with mock.patch.object(
-            self.m_mv._model_ops._metadata_ops, "load", return_value=m_metadata
-        ) as mock_load, mock.patch.object(self.m_mv._model_ops._metadata_ops, "save") as mock_save:
+            self.m_mv._model_ops._metadata_ops, "_get_current_metadata_dict", return_value=m_meta
+        ) as mock_get_current_metadata_dict, mock.patch.object(
+            self.m_mv._model_ops._metadata_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
             self.m_mv.set_metric("b", 2)
-            mock_load.assert_called_once_with(
+            mock_get_current_metadata_dict.assert_called_once_with(
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
                 version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
                 statement_params=mock.ANY,
             )
-            mock_save.assert_called_once_with(
-                metadata_ops.ModelVersionMetadataSchema(metrics={"a": 1, "b": 2}),
+            mock_set_metadata.assert_called_once_with(
+                {
+                    "snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION,
+                    "metrics": {"a": 1, "b": 2},
+                },
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
@@ -146,20 +173,22 @@ class ModelVersionImplTest(absltest.TestCase):
             )
 
     def test_delete_metric_1(self) -> None:
-        m_metadata = metadata_ops.ModelVersionMetadataSchema(metrics={"a": 1})
+        m_meta = {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 1}}
         with mock.patch.object(
-            self.m_mv._model_ops._metadata_ops, "load", return_value=m_metadata
-        ) as mock_load, mock.patch.object(self.m_mv._model_ops._metadata_ops, "save") as mock_save:
+            self.m_mv._model_ops._metadata_ops, "_get_current_metadata_dict", return_value=m_meta
+        ) as mock_get_current_metadata_dict, mock.patch.object(
+            self.m_mv._model_ops._metadata_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
             self.m_mv.delete_metric("a")
-            mock_load.assert_called_once_with(
+            mock_get_current_metadata_dict.assert_called_once_with(
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
                 version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
                 statement_params=mock.ANY,
             )
-            mock_save.assert_called_once_with(
-                metadata_ops.ModelVersionMetadataSchema(metrics={}),
+            mock_set_metadata.assert_called_once_with(
+                {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {}},
                 database_name=None,
                 schema_name=None,
                 model_name=sql_identifier.SqlIdentifier("MODEL"),
@@ -168,27 +197,36 @@ class ModelVersionImplTest(absltest.TestCase):
             )
 
     def test_delete_metric_2(self) -> None:
-        m_metadata = metadata_ops.ModelVersionMetadataSchema(metrics={"a": 1})
+        m_meta = {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 1}}
         with mock.patch.object(
-            self.m_mv._model_ops._metadata_ops, "load", return_value=m_metadata
-        ) as mock_load, mock.patch.object(self.m_mv._model_ops._metadata_ops, "save") as mock_save:
+            self.m_mv._model_ops._metadata_ops, "_get_current_metadata_dict", return_value=m_meta
+        ) as mock_get_current_metadata_dict, mock.patch.object(
+            self.m_mv._model_ops._metadata_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
             with self.assertRaisesRegex(KeyError, "Cannot find metric with name b"):
                 self.m_mv.delete_metric("b")
-                mock_load.assert_called_once_with(
-                    database_name=None,
-                    schema_name=None,
-                    model_name=sql_identifier.SqlIdentifier("MODEL"),
-                    version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-                    statement_params=mock.ANY,
-                )
-                mock_save.assert_not_called()
+            mock_get_current_metadata_dict.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                statement_params=mock.ANY,
+            )
+            mock_set_metadata.assert_not_called()
 
     def test_show_functions(self) -> None:
         with mock.patch.object(
             self.m_mv._model_ops, attribute="get_functions", return_value=[123]
         ) as mock_get_functions:
-            self.assertListEqual([], self.m_mv.show_functions())
-            mock_get_functions.assert_not_called()
+            self.assertListEqual([123], self.m_mv.show_functions())
+            self.assertListEqual([123], self.m_mv.show_functions())
+            mock_get_functions.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                statement_params=mock.ANY,
+            )
 
     def test_get_functions(self) -> None:
         with mock.patch.object(
@@ -428,6 +466,44 @@ class ModelVersionImplTest(absltest.TestCase):
                 statement_params=mock.ANY,
             )
 
+    def test_comment_cache(self) -> None:
+        with mock.patch.object(
+            self.m_mv._model_ops, "get_comment", return_value="this is a comment"
+        ) as mock_get_comment, mock.patch.object(self.m_mv._model_ops, "set_comment"):
+            self.assertEqual("this is a comment", self.m_mv.comment)
+            self.assertEqual("this is a comment", self.m_mv.description)
+            mock_get_comment.assert_called_once()
+
+            self.m_mv.comment = "this is another comment"
+            self.assertEqual("this is another comment", self.m_mv.comment)
+            mock_get_comment.assert_called_once()
+
+            self.m_mv.invalidate()
+            self.assertEqual("this is a comment", self.m_mv.comment)
+            self.assertEqual(2, mock_get_comment.call_count)
+
+    def test_metrics_cache(self) -> None:
+        m_meta = {"snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION, "metrics": {"a": 1}}
+        with mock.patch.object(
+            self.m_mv._model_ops._metadata_ops, "load", return_value=metadata_ops.ModelVersionMetadataSchema(metrics={})
+        ) as mock_load, mock.patch.object(
+            self.m_mv._model_ops._metadata_ops, "_get_current_metadata_dict", return_value=m_meta
+        ), mock.patch.object(
+            self.m_mv._model_ops._metadata_ops._model_version_client, "set_metadata"
+        ):
+            self.m_mv.set_metric("b", 2)
+            self.assertDictEqual({"a": 1, "b": 2}, self.m_mv.show_metrics())
+            self.assertEqual(2, self.m_mv.get_metric("b"))
+            mock_load.assert_not_called()
+
+            self.m_mv.show_metrics()["c"] = 3
+            self.assertDictEqual({"a": 1, "b": 2}, self.m_mv.show_metrics())
+
+            self.m_mv.invalidate()
+            self.assertDictEqual({}, self.m_mv.show_metrics())
+            self.assertDictEqual({}, self.m_mv.show_metrics())
+            mock_load.assert_called_once()
+
     def test_export_invalid_path(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             with open(os.path.join(tmpdir, "dummy"), mode="w") as f:
@@ -450,6 +526,23 @@ class ModelVersionImplTest(absltest.TestCase):
                 statement_params=mock.ANY,
             )
 
+    def test_export_new_dir(self) -> None:
+        with mock.patch.object(
+            self.m_mv._model_ops, "download_files"
+        ) as mock_download_files, tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "export")
+            self.m_mv.export(target_path)
+            self.assertTrue(os.path.isdir(target_path))
+            mock_download_files.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                target_path=pathlib.Path(target_path),
+                mode="model",
+                statement_params=mock.ANY,
+            )
+
     def test_export_full(self) -> None:
         with mock.patch.object(
             self.m_mv._model_ops, "download_files"
@@ -481,37 +574,28 @@ class ModelVersionImplTest(absltest.TestCase):
             model_composer.ModelComposer, "load", side_effect=[m_pk_for_validation, m_pk]
         ) as mock_load, mock.patch.object(
             m_pk_for_validation.meta.env, "validate_with_local_env", return_value=[]
-        ) as mock_validate_with_local_env:
+        ) as mock_validate_with_local_env, mock.patch.object(
+            model_version_impl.weakref, "finalize"
+        ) as mock_finalize:
             self.assertEqual(self.m_mv.load(options=m_options), m_model)
-            mock_download_files.assert_has_calls(
-                [
-                    mock.call(
-                        database_name=None,
-                        schema_name=None,
-                        model_name=sql_identifier.SqlIdentifier("MODEL"),
-                        version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-                        target_path=mock.ANY,
-                        mode="minimal",
-                        statement_params=mock.ANY,
-                    ),
-                    mock.call(
-                        database_name=None,
-                        schema_name=None,
-                        model_name=sql_identifier.SqlIdentifier("MODEL"),
-                        version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-                        target_path=mock.ANY,
-                        mode="model",
-                        statement_params=mock.ANY,
-                    ),
-                ]
+            mock_download_files.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                target_path=mock.ANY,
+                mode="model",
+                statement_params=mock.ANY,
             )
+            workspace = mock_download_files.call_args.kwargs["target_path"]
             mock_load.assert_has_calls(
                 [
-                    mock.call(mock.ANY, meta_only=True, options=m_options),
-                    mock.call(mock.ANY, meta_only=False, options=m_options),
+                    mock.call(workspace, meta_only=True, options=m_options),
+                    mock.call(workspace, meta_only=False, options=m_options),
                 ]
             )
             mock_validate_with_local_env.assert_called_once_with(check_snowpark_ml_version=False)
+            mock_finalize.assert_called_once_with(m_model, shutil.rmtree, workspace, ignore_errors=True)
 
     def test_load_error(self) -> None:
         m_pk_for_validation = mock.MagicMock()
@@ -532,24 +616,17 @@ class ModelVersionImplTest(absltest.TestCase):
         ) as mock_validate_with_local_env:
             with self.assertRaisesRegex(ValueError, "Unable to load this model due to following validation errors"):
                 self.assertEqual(self.m_mv.load(options=m_options), m_model)
-            mock_download_files.assert_has_calls(
-                [
-                    mock.call(
-                        database_name=None,
-                        schema_name=None,
-                        model_name=sql_identifier.SqlIdentifier("MODEL"),
-                        version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
-                        target_path=mock.ANY,
-                        mode="minimal",
-                        statement_params=mock.ANY,
-                    ),
-                ]
-            )
-            mock_load.assert_has_calls(
-                [
-                    mock.call(mock.ANY, meta_only=True, options=m_options),
-                ]
+            mock_download_files.assert_called_once_with(
+                database_name=None,
+                schema_name=None,
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("v1", case_sensitive=True),
+                target_path=mock.ANY,
+                mode="model",
+                statement_params=mock.ANY,
             )
+            mock_load.assert_called_once_with(mock.ANY, meta_only=True, options=m_options)
+            self.assertFalse(mock_download_files.call_args.kwargs["target_path"].exists())
             mock_validate_with_local_env.assert_called_once_with(check_snowpark_ml_version=True)
 
     def test_load_force(self) -> None:
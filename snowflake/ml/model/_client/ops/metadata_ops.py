@@ -1,9 +1,9 @@
 import json
-from typing import Any, Dict, Optional, TypedDict
+from typing import Any, Callable, Dict, Optional, TypedDict
 
 from typing_extensions import NotRequired
 
-from snowflake.ml._internal.utils import sql_identifier
+from snowflake.ml._internal.utils import json_utils, sql_identifier
 from snowflake.ml.model._client.sql import (
     model as model_sql,
     model_version as model_version_sql,
@@ -77,7 +77,11 @@ class MetadataOperator:
         metadata_str = version_info_list[0][self._model_client.MODEL_VERSION_METADATA_COL_NAME]
         if not metadata_str:
             return {}
-        res = json.loads(metadata_str)
+        try:
+            res = json_utils.loads(metadata_str)
+        except json_utils.JSONDecodeError:
+            # Metadata written by json.dumps may contain NaN or Infinity, which only the standard library accepts.
+            res = json.loads(metadata_str)
         if not isinstance(res, dict):
             raise ValueError(f"Metadata is expected to be a dictionary, getting {res}")
         return res
@@ -126,3 +130,31 @@ class MetadataOperator:
             version_name=version_name,
             statement_params=statement_params,
         )
+
+    def update(
+        self,
+        updater: Callable[[ModelVersionMetadataSchema], ModelVersionMetadataSchema],
+        *,
+        database_name: Optional[sql_identifier.SqlIdentifier],
+        schema_name: Optional[sql_identifier.SqlIdentifier],
+        model_name: sql_identifier.SqlIdentifier,
+        version_name: sql_identifier.SqlIdentifier,
+        statement_params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        metadata_dict = self._get_current_metadata_dict(
+            database_name=database_name,
+            schema_name=schema_name,
+            model_name=model_name,
+            version_name=version_name,
+            statement_params=statement_params,
+        )
+        metadata = updater(MetadataOperator._parse(metadata_dict))
+        metadata_dict.update({**metadata, "snowpark_ml_schema_version": MODEL_VERSION_METADATA_SCHEMA_VERSION})
+        self._model_version_client.set_metadata(
+            metadata_dict,
+            database_name=database_name,
+            schema_name=schema_name,
+            model_name=model_name,
+            version_name=version_name,
+            statement_params=statement_params,
+        )
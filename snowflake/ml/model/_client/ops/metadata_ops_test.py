@@ -1,4 +1,5 @@
 import json
+import math
 from typing import Any, Dict, cast
 from unittest import mock
 
@@ -144,6 +145,27 @@ class metadataOpsTest(absltest.TestCase):
                 statement_params=self.m_statement_params,
             )
 
+    def test_get_metadata_dict_non_finite(self) -> None:
+        m_list_res = [
+            Row(
+                create_on="06/01",
+                name="Model",
+                metadata='{"metrics": {"a": NaN}}',
+                model_name="MODEL",
+                database_name="TEMP",
+                schema_name="test",
+            ),
+        ]
+        with mock.patch.object(self.m_ops._model_client, "show_versions", return_value=m_list_res):
+            metadata_dict = self.m_ops._get_current_metadata_dict(
+                database_name=sql_identifier.SqlIdentifier("TEMP"),
+                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=self.m_statement_params,
+            )
+            self.assertTrue(math.isnan(metadata_dict["metrics"]["a"]))
+
     def test_load_1(self) -> None:
         m_meta: Dict[str, Any] = {}
         with mock.patch.object(
@@ -485,6 +507,61 @@ class metadataOpsTest(absltest.TestCase):
                 statement_params=self.m_statement_params,
             )
 
+    def test_update_1(self) -> None:
+        m_meta: Dict[str, Any] = {
+            "snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION,
+            "metrics": {"a": 1},
+            "foo": "bar",
+        }
+        with mock.patch.object(
+            self.m_ops, "_get_current_metadata_dict", return_value=m_meta
+        ) as mock_get_current_metadata_dict, mock.patch.object(
+            self.m_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
+            self.m_ops.update(
+                lambda metadata: metadata_ops.ModelVersionMetadataSchema(metrics={**metadata["metrics"], "b": 2}),
+                database_name=sql_identifier.SqlIdentifier("TEMP"),
+                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=self.m_statement_params,
+            )
+            mock_get_current_metadata_dict.assert_called_once_with(
+                database_name=sql_identifier.SqlIdentifier("TEMP"),
+                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=self.m_statement_params,
+            )
+            mock_set_metadata.assert_called_once_with(
+                {
+                    "snowpark_ml_schema_version": metadata_ops.MODEL_VERSION_METADATA_SCHEMA_VERSION,
+                    "metrics": {"a": 1, "b": 2},
+                    "foo": "bar",
+                },
+                database_name=sql_identifier.SqlIdentifier("TEMP"),
+                schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+                model_name=sql_identifier.SqlIdentifier("MODEL"),
+                version_name=sql_identifier.SqlIdentifier("V1"),
+                statement_params=self.m_statement_params,
+            )
+
+    def test_update_2(self) -> None:
+        m_meta: Dict[str, Any] = {"snowpark_ml_schema_version": "2023-12-01"}
+        with mock.patch.object(self.m_ops, "_get_current_metadata_dict", return_value=m_meta), mock.patch.object(
+            self.m_ops._model_version_client, "set_metadata"
+        ) as mock_set_metadata:
+            with self.assertRaisesRegex(ValueError, "Unsupported model metadata schema version"):
+                self.m_ops.update(
+                    lambda metadata: metadata,
+                    database_name=sql_identifier.SqlIdentifier("TEMP"),
+                    schema_name=sql_identifier.SqlIdentifier("test", case_sensitive=True),
+                    model_name=sql_identifier.SqlIdentifier("MODEL"),
+                    version_name=sql_identifier.SqlIdentifier("V1"),
+                    statement_params=self.m_statement_params,
+                )
+            mock_set_metadata.assert_not_called()
+
 
 if __name__ == "__main__":
     absltest.main()
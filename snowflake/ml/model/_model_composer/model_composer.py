@@ -3,11 +3,12 @@ import pathlib
 import tempfile
 import uuid
 import zipfile
-from types import ModuleType
-from typing import Any, Dict, List, Optional
+from concurrent import futures
+from types import ModuleType, TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from absl import logging
-from packaging import requirements
+from packaging import requirements, version
 from typing_extensions import deprecated
 
 from snowflake.ml._internal import env as snowml_env, env_utils, file_utils
@@ -20,6 +21,24 @@ from snowflake.snowpark import Session
 from snowflake.snowpark._internal import utils as snowpark_utils
 
 
+# Matched versions per local library version. Only non-empty results are kept, as an empty one may come from the
+# channel being unreachable and is looked up again on the next call.
+_snowml_versions_in_snowflake_conda_channel: Dict[str, Tuple[version.Version, ...]] = {}
+
+
+def _get_matched_snowml_versions_in_snowflake_conda_channel(snowml_version: str) -> Tuple[version.Version, ...]:
+    matched_versions = _snowml_versions_in_snowflake_conda_channel.get(snowml_version)
+    if matched_versions is None:
+        matched_versions = tuple(
+            env_utils.get_matched_package_versions_in_snowflake_conda_channel(
+                req=requirements.Requirement(f"snowflake-ml-python=={snowml_version}")
+            )
+        )
+        if matched_versions:
+            _snowml_versions_in_snowflake_conda_channel[snowml_version] = matched_versions
+    return matched_versions
+
+
 class ModelComposer:
     """Top-level class to construct contents in a MODEL object in SQL.
 
@@ -47,8 +66,12 @@ class ModelComposer:
         self.session = session
         self.stage_path = pathlib.PurePosixPath(stage_path)
 
+        # Both workspaces live in a single temporary directory, so that there is only one tree to create and clean up.
         self._workspace = tempfile.TemporaryDirectory()
-        self._packager_workspace = tempfile.TemporaryDirectory()
+        self.workspace_path = pathlib.Path(self._workspace.name) / "workspace"
+        self._packager_workspace_path = pathlib.Path(self._workspace.name) / "packager_workspace"
+        self.workspace_path.mkdir()
+        self._packager_workspace_path.mkdir()
 
         self.packager = model_packager.ModelPackager(local_dir_path=str(self._packager_workspace_path))
         self.manifest = model_manifest.ModelManifest(workspace_path=self.workspace_path)
@@ -57,17 +80,24 @@ class ModelComposer:
 
         self._statement_params = statement_params
 
-    def __del__(self) -> None:
-        self._workspace.cleanup()
-        self._packager_workspace.cleanup()
+    def __enter__(self) -> "ModelComposer":
+        return self
 
-    @property
-    def workspace_path(self) -> pathlib.Path:
-        return pathlib.Path(self._workspace.name)
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.cleanup()
 
-    @property
-    def _packager_workspace_path(self) -> pathlib.Path:
-        return pathlib.Path(self._packager_workspace.name)
+    def cleanup(self) -> None:
+        """Remove the local workspaces.
+
+        Prefer using the composer as a context manager. Workspaces of a composer that is never cleaned up explicitly
+        are removed when it is garbage collected.
+        """
+        self._workspace.cleanup()
 
     @property
     def model_stage_path(self) -> str:
@@ -96,9 +126,7 @@ class ModelComposer:
             options = model_types.BaseModelSaveOption()
 
         if not snowpark_utils.is_in_stored_procedure():  # type: ignore[no-untyped-call]
-            snowml_matched_versions = env_utils.get_matched_package_versions_in_snowflake_conda_channel(
-                req=requirements.Requirement(f"snowflake-ml-python=={snowml_env.VERSION}")
-            )
+            snowml_matched_versions = _get_matched_snowml_versions_in_snowflake_conda_channel(snowml_env.VERSION)
 
             if len(snowml_matched_versions) < 1 and options.get("embed_local_ml_library", False) is False:
                 logging.info(
@@ -122,22 +150,34 @@ class ModelComposer:
         )
         assert self.packager.meta is not None
 
+        loose_model_dir = None
         if not options.get("_legacy_save", False):
             # Keep both loose files and zipped file.
             # TODO(SNOW-726678): Remove once import a directory is possible.
-            file_utils.copytree(
-                str(self._packager_workspace_path), str(self.workspace_path / ModelComposer.MODEL_DIR_REL_PATH)
+            loose_model_dir = str(self.workspace_path / ModelComposer.MODEL_DIR_REL_PATH)
+
+        data_sources = self._get_data_sources(model, sample_input_data)
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            # The manifest only depends on the model metadata and writes to other paths than the archive, so it is
+            # generated while the model files are being archived.
+            manifest_future = executor.submit(
+                self.manifest.save,
+                session=self.session,
+                model_meta=model_metadata,
+                model_file_rel_path=pathlib.PurePosixPath(self.model_file_rel_path),
+                options=options,
+                data_sources=data_sources,
             )
 
-        file_utils.make_archive(self.model_local_path, str(self._packager_workspace_path))
-
-        self.manifest.save(
-            session=self.session,
-            model_meta=model_metadata,
-            model_file_rel_path=pathlib.PurePosixPath(self.model_file_rel_path),
-            options=options,
-            data_sources=self._get_data_sources(model, sample_input_data),
-        )
+            # Model files are mostly serialized weights that barely compress, so storing them uncompressed saves CPU
+            # time on both save and extraction in the warehouse.
+            file_utils.make_zip_archive(
+                self.model_local_path,
+                str(self._packager_workspace_path),
+                copy_dir=loose_model_dir,
+                compression=zipfile.ZIP_STORED,
+            )
+            manifest_future.result()
 
         file_utils.upload_directory_to_stage(
             self.session,
@@ -165,7 +205,7 @@ class ModelComposer:
         model_zip_path = pathlib.Path(glob.glob(str(self.workspace_path / "*.zip"))[0])
         self.model_file_rel_path = str(model_zip_path.relative_to(self.workspace_path))
 
-        with zipfile.ZipFile(self.model_local_path, mode="r", compression=zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(self.model_local_path, mode="r") as zf:
             zf.extractall(path=self._packager_workspace_path)
         self.packager.load(meta_only=meta_only, options=options)
 
@@ -183,9 +223,8 @@ class ModelComposer:
     def _get_data_sources(
         self, model: model_types.SupportedModelType, sample_input_data: Optional[model_types.SupportedDataType] = None
     ) -> Optional[List[data_source.DataSource]]:
+        # get_data_sources only ever returns None or a list of validated DataSource objects.
         data_sources = lineage_utils.get_data_sources(model)
         if not data_sources and sample_input_data is not None:
             data_sources = lineage_utils.get_data_sources(sample_input_data)
-        if isinstance(data_sources, list) and all(isinstance(item, data_source.DataSource) for item in data_sources):
-            return data_sources
-        return None
+        return data_sources
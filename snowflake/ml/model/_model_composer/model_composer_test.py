@@ -6,6 +6,7 @@ from unittest import mock
 import numpy as np
 import pandas as pd
 from absl.testing import absltest
+from packaging import version
 from sklearn import linear_model
 
 from snowflake.ml._internal import env_utils, file_utils
@@ -87,6 +88,37 @@ class ModelInterfaceTest(absltest.TestCase):
                     statement_params=None,
                 )
 
+    def test_cleanup(self) -> None:
+        m_session = mock_session.MockSession(conn=None, test_case=self)
+        c_session = cast(Session, m_session)
+
+        with model_composer.ModelComposer(session=c_session, stage_path='@"db"."schema"."stage"') as m:
+            workspace_path = m.workspace_path
+            packager_workspace_path = m._packager_workspace_path
+            self.assertTrue(workspace_path.is_dir())
+            self.assertTrue(packager_workspace_path.is_dir())
+            self.assertNotIn(workspace_path, packager_workspace_path.parents)
+
+        self.assertFalse(workspace_path.exists())
+        self.assertFalse(packager_workspace_path.exists())
+
+    def test_get_matched_snowml_versions_in_snowflake_conda_channel(self) -> None:
+        model_composer._snowml_versions_in_snowflake_conda_channel.clear()
+        self.addCleanup(model_composer._snowml_versions_in_snowflake_conda_channel.clear)
+        with mock.patch.object(
+            env_utils,
+            "get_matched_package_versions_in_snowflake_conda_channel",
+            side_effect=[[], [version.Version("1.5.0")]],
+        ) as mock_get_matched_versions:
+            # An empty result may come from the channel being unreachable, so it is looked up again.
+            self.assertEqual((), model_composer._get_matched_snowml_versions_in_snowflake_conda_channel("1.5.0"))
+            for _ in range(2):
+                self.assertEqual(
+                    (version.Version("1.5.0"),),
+                    model_composer._get_matched_snowml_versions_in_snowflake_conda_channel("1.5.0"),
+                )
+            self.assertEqual(2, mock_get_matched_versions.call_count)
+
     def test_load(self) -> None:
         m_options = model_types.PyTorchLoadOptions(use_gpu=False)
         with mock.patch.object(model_packager.ModelPackager, "load") as mock_load:
@@ -1,14 +1,16 @@
+import asyncio
+import atexit
 import fcntl
-import functools
 import inspect
 import os
+import shutil
+import struct
 import sys
-import threading
 import zipfile
+from concurrent import futures
 from types import TracebackType
-from typing import Optional, Type
+from typing import List, Optional, Tuple, Type
 
-import anyio
 import pandas as pd
 from _snowflake import vectorized
 
@@ -16,17 +18,65 @@ from snowflake.ml.model._packager import model_packager
 
 
 class FileLock:
+    def __init__(self, path: str) -> None:
+        self._path = path
+
     def __enter__(self) -> None:
-        self._lock = threading.Lock()
-        self._lock.acquire()
-        self._fd = open("/tmp/lockfile.LOCK", "w+")
+        self._fd = open(self._path, "w+")
         fcntl.lockf(self._fd, fcntl.LOCK_EX)
 
     def __exit__(
         self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], traceback: Optional[TracebackType]
     ) -> None:
         self._fd.close()
-        self._lock.release()
+
+
+def extract_model(zip_path: str, dest_dir: str) -> None:
+    # Stored entries are copied by the kernel straight from the archive, instead of going through the chunked read
+    # loop of ZipFile.extractall. Each entry goes to its own file, so entries are extracted concurrently.
+    dest_root = os.path.realpath(dest_dir)
+    with zipfile.ZipFile(zip_path, "r") as myzip, open(zip_path, "rb") as zip_file:
+        file_infos = []
+        for zi in myzip.infolist():
+            # Unlike ZipFile.extractall, entry names are joined as they are, so reject any escaping the destination.
+            dest_path = os.path.realpath(os.path.join(dest_root, zi.filename))
+            if os.path.commonpath([dest_root, dest_path]) != dest_root:
+                raise ValueError(f"Archive entry {zi.filename} would be extracted outside of {dest_dir}.")
+            if zi.is_dir():
+                os.makedirs(dest_path, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                file_infos.append((zi, dest_path))
+
+        def extract_file(file_info: Tuple[zipfile.ZipInfo, str]) -> None:
+            zi, dest_path = file_info
+            with open(dest_path, "wb") as dest_file:
+                if zi.compress_type != zipfile.ZIP_STORED:
+                    with myzip.open(zi) as src_file:
+                        shutil.copyfileobj(src_file, dest_file, 1 << 20)
+                    return
+                # Entry data follows the 30-byte local file header and its file name and extra fields.
+                name_length, extra_length = struct.unpack("<HH", os.pread(zip_file.fileno(), 4, zi.header_offset + 26))
+                offset = zi.header_offset + 30 + name_length + extra_length
+                remaining = zi.file_size
+                while remaining > 0:
+                    sent = os.sendfile(dest_file.fileno(), zip_file.fileno(), offset, remaining)
+                    if sent == 0:
+                        raise EOFError(f"Unexpected end of archive while extracting {zi.filename}.")
+                    offset += sent
+                    remaining -= sent
+
+        with futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            # Consume the results so that the first failed entry raises.
+            list(executor.map(extract_file, file_infos))
+
+
+def find_extracted_model_dir(extracted_dir_paths: List[str], extracted_model_dir_name: str) -> Optional[str]:
+    for extracted_dir_path in extracted_dir_paths:
+        extracted_model_dir_path = os.path.join(extracted_dir_path, extracted_model_dir_name)
+        if os.path.isdir(extracted_model_dir_path):
+            return extracted_model_dir_path
+    return None
 
 
 # User-defined parameters
@@ -41,13 +91,39 @@ import_dir = sys._xoptions[IMPORT_DIRECTORY_NAME]
 
 model_dir_name = os.path.splitext(MODEL_FILE_NAME)[0]
 zip_model_path = os.path.join(import_dir, MODEL_FILE_NAME)
+# Key the extraction on the archive size and modification time, so that a changed archive is never served from a
+# stale extraction while an unchanged one is reused.
+zip_model_stat = os.stat(zip_model_path)
+extracted_model_dir_name = f"{model_dir_name}-{zip_model_stat.st_size}-{int(zip_model_stat.st_mtime)}"
 extracted = "/tmp/models"
-extracted_model_dir_path = os.path.join(extracted, model_dir_name)
-
-with FileLock():
-    if not os.path.isdir(extracted_model_dir_path):
-        with zipfile.ZipFile(zip_model_path, "r") as myzip:
-            myzip.extractall(extracted_model_dir_path)
+# Extract to shared memory when it has room for the model, so that model files are read at memory speed.
+shm_extracted = "/dev/shm/models"
+extracted_model_dir_path = find_extracted_model_dir([shm_extracted, extracted], extracted_model_dir_name)
+
+# The directory only exists once complete, so workers finding it skip the lock; the others serialize per model.
+if extracted_model_dir_path is None:
+    os.makedirs(extracted, exist_ok=True)
+    with FileLock(os.path.join(extracted, f"{extracted_model_dir_name}.LOCK")):
+        extracted_model_dir_path = find_extracted_model_dir([shm_extracted, extracted], extracted_model_dir_name)
+        if extracted_model_dir_path is None:
+            with zipfile.ZipFile(zip_model_path, "r") as myzip:
+                extracted_size = sum(zi.file_size for zi in myzip.infolist())
+            try:
+                # Leave as much room again for the memory used by the model itself.
+                use_shm = shutil.disk_usage("/dev/shm").free > 2 * extracted_size
+            except OSError:
+                use_shm = False
+            extracted_model_dir_path = os.path.join(shm_extracted if use_shm else extracted, extracted_model_dir_name)
+            os.makedirs(os.path.dirname(extracted_model_dir_path), exist_ok=True)
+            # Extract aside and rename, so that the directory only exists once the extraction is complete.
+            extracting_model_dir_path = f"{extracted_model_dir_path}.{os.getpid()}.tmp"
+            try:
+                extract_model(zip_model_path, extracting_model_dir_path)
+            except BaseException:
+                # Do not leave a partial extraction behind, it may hold on to shared memory.
+                shutil.rmtree(extracting_model_dir_path, ignore_errors=True)
+                raise
+            os.rename(extracting_model_dir_path, extracted_model_dir_path)
 
 # Load the model
 pk = model_packager.ModelPackager(extracted_model_dir_path)
@@ -60,13 +136,19 @@ model = pk.model
 meta = pk.meta
 func = getattr(model, TARGET_METHOD)
 if inspect.iscoroutinefunction(func):
-    runner = functools.partial(anyio.run, func)
+    # Reuse a single event loop across batches rather than setting one up and tearing it down for each of them.
+    loop = asyncio.new_event_loop()
+    atexit.register(loop.close)
+
+    def runner(df: pd.DataFrame) -> pd.DataFrame:
+        return loop.run_until_complete(func(df))
+
 else:
-    runner = functools.partial(func)
+    runner = func
 
 # Determine preprocess parameters
 features = meta.signatures[TARGET_METHOD].inputs
-input_cols = [feature.name for feature in features]
+input_cols = pd.Index([feature.name for feature in features])
 dtype_map = {feature.name: feature.as_dtype() for feature in features}
 
 
@@ -74,6 +156,10 @@ dtype_map = {feature.name: feature.as_dtype() for feature in features}
 class infer:
     @vectorized(input=pd.DataFrame)
     def end_partition(self, df: pd.DataFrame) -> pd.DataFrame:
-        df.columns = input_cols
-        input_df = df.astype(dtype=dtype_map)
-        return runner(input_df[input_cols])
+        if not df.columns.equals(input_cols):
+            df.columns = input_cols
+        # Only cast the columns whose type differs, as casting a column copies it even if the type already matches.
+        casts = {col: dtype for col, dtype in dtype_map.items() if df[col].dtype != dtype}
+        if casts:
+            df = df.astype(dtype=casts, copy=False)
+        return runner(df)
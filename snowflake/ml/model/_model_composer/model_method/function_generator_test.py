@@ -1,5 +1,10 @@
+import os
 import pathlib
+import sys
 import tempfile
+import zipfile
+from typing import Any, Dict
+from unittest import mock
 
 import importlib_resources
 from absl.testing import absltest
@@ -95,5 +100,54 @@ class FunctionGeneratorTest(absltest.TestCase):
                 )
 
 
+class ExtractModelTest(absltest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Load the helpers defined ahead of the handler's module level code, which only runs inside Snowflake.
+        source = (
+            importlib_resources.files("snowflake.ml.model._model_composer.model_method")
+            .joinpath("fixtures")
+            .joinpath("function_1.py")
+            .read_text()
+        )
+        helpers_source = source[: source.index("# User-defined parameters")]
+        cls.handler_helpers: Dict[str, Any] = {}
+        with mock.patch.dict(sys.modules, {"_snowflake": mock.MagicMock()}):
+            exec(compile(helpers_source, "function_1.py", "exec"), cls.handler_helpers)
+
+    def test_extract_model(self) -> None:
+        files = {
+            "MANIFEST.yml": b"manifest_version: 1.0\n",
+            "model/model.yaml": b"name: model\n" * 100,
+            "model/empty": b"",
+            "model/models/model/model.pkl": bytes(range(256)) * (3 << 12),
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for compression in [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED]:
+                zip_path = os.path.join(tmpdir, f"model_{compression}.zip")
+                with zipfile.ZipFile(zip_path, "w", compression=compression) as zf:
+                    zf.writestr("model/", b"")
+                    for file_name, content in files.items():
+                        zf.writestr(file_name, content)
+
+                dest_dir = os.path.join(tmpdir, f"extracted_{compression}")
+                self.handler_helpers["extract_model"](zip_path, dest_dir)
+                for file_name, content in files.items():
+                    self.assertEqual(content, pathlib.Path(dest_dir, file_name).read_bytes())
+
+    def test_extract_model_outside_of_dest_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest_dir = os.path.join(tmpdir, "a", "b", "extracted")
+            for file_name in ["../../evil.txt", "model/../../../evil.txt", os.path.join(tmpdir, "evil.txt")]:
+                zip_path = os.path.join(tmpdir, "model.zip")
+                with zipfile.ZipFile(zip_path, "w") as zf:
+                    zf.writestr(zipfile.ZipInfo(file_name), b"evil")
+
+                with self.assertRaises(ValueError):
+                    self.handler_helpers["extract_model"](zip_path, dest_dir)
+                self.assertFalse(os.path.exists(os.path.join(tmpdir, "a", "evil.txt")))
+                self.assertFalse(os.path.exists(os.path.join(tmpdir, "evil.txt")))
+
+
 if __name__ == "__main__":
     absltest.main()
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import pathlib
 import tempfile
 import warnings
 
@@ -42,11 +43,9 @@ class ComposeModel(custom_model.CustomModel):
 
     @custom_model.inference_api
     def predict(self, input: pd.DataFrame) -> pd.DataFrame:
-        return pd.DataFrame(
-            (self.context.model_ref("m1").predict(input)["c1"] + self.context.model_ref("m2").predict(input)["output"])
-            / 2,
-            columns=["output"],
-        )
+        res1 = self.context.model_ref("m1").predict(input)["c1"].to_numpy()
+        res2 = self.context.model_ref("m2").predict(input)["output"].to_numpy()
+        return pd.DataFrame((res1 + res2) / 2, columns=["output"], index=input.index)
 
 
 class AsyncComposeModel(custom_model.CustomModel):
@@ -55,9 +54,13 @@ class AsyncComposeModel(custom_model.CustomModel):
 
     @custom_model.inference_api
     async def predict(self, input: pd.DataFrame) -> pd.DataFrame:
-        res1 = await self.context.model_ref("m1").predict.async_run(input)
-        res_sum = res1["output"] + self.context.model_ref("m2").predict(input)["output"]
-        return pd.DataFrame(res_sum / 2)
+        res1, res2 = await asyncio.gather(
+            self.context.model_ref("m1").predict.async_run(input),
+            self.context.model_ref("m2").predict.async_run(input),
+        )
+        return pd.DataFrame(
+            (res1["output"].to_numpy() + res2["output"].to_numpy()) / 2, columns=["output"], index=input.index
+        )
 
 
 class DemoModelWithArtifacts(custom_model.CustomModel):
@@ -69,24 +72,30 @@ class DemoModelWithArtifacts(custom_model.CustomModel):
 
     @custom_model.inference_api
     def predict(self, input: pd.DataFrame) -> pd.DataFrame:
-        return pd.DataFrame({"output": input["c1"] + self.bias})
+        return pd.DataFrame(input["c1"].to_numpy() + self.bias, columns=["output"], index=input.index)
 
 
 class DemoModelWithManyArtifacts(custom_model.CustomModel):
     def __init__(self, context: custom_model.ModelContext) -> None:
         super().__init__(context)
-        with open(os.path.join(context.path("bias"), "bias1"), encoding="utf-8") as f:
-            v1 = int(f.read())
-        with open(os.path.join(context.path("bias"), "bias2"), encoding="utf-8") as f:
-            v2 = int(f.read())
-        self.bias = v1 + v2
+        bias_dir = pathlib.Path(context.path("bias"))
+        self.bias = sum(int((bias_dir / name).read_text(encoding="utf-8")) for name in ["bias1", "bias2"])
 
     @custom_model.inference_api
     def predict(self, input: pd.DataFrame) -> pd.DataFrame:
-        return pd.DataFrame({"output": input["c1"] + self.bias})
+        return pd.DataFrame(input["c1"].to_numpy() + self.bias, columns=["output"], index=input.index)
 
 
 class CustomHandlerTest(absltest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # asyncio.get_event_loop() is deprecated when no loop is running; async tests share this loop instead.
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.loop.close()
+
     def test_custom_model_with_multiple_artifacts(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             os.mkdir(os.path.join(tmpdir, "bias"))
@@ -117,7 +126,7 @@ class CustomHandlerTest(absltest.TestCase):
                 assert pk.meta
                 assert isinstance(pk.model, DemoModelWithManyArtifacts)
                 res = pk.model.predict(d)
-                np.testing.assert_allclose(res["output"], pd.Series(np.array([94, 97])))
+                np.testing.assert_array_equal(res["output"].to_numpy(), np.array([94, 97]))
 
                 pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
                 pk.load(as_custom_model=True)
@@ -125,7 +134,7 @@ class CustomHandlerTest(absltest.TestCase):
                 assert pk.meta
                 assert isinstance(pk.model, DemoModelWithManyArtifacts)
                 res = pk.model.predict(d)
-                np.testing.assert_allclose(res["output"], pd.Series(np.array([94, 97])))
+                np.testing.assert_array_equal(res["output"].to_numpy(), np.array([94, 97]))
                 self.assertEqual(pk.meta.metadata["author"] if pk.meta.metadata else None, "halu")
 
                 model_packager.ModelPackager(os.path.join(tmpdir, "model1_no_sig")).save(
@@ -142,7 +151,7 @@ class CustomHandlerTest(absltest.TestCase):
                 assert pk.meta
                 assert isinstance(pk.model, DemoModelWithManyArtifacts)
                 res = pk.model.predict(d)
-                np.testing.assert_allclose(res["output"], pd.Series(np.array([94, 97])))
+                np.testing.assert_array_equal(res["output"].to_numpy(), np.array([94, 97]))
                 self.assertEqual(s, pk.meta.signatures)
 
     def test_model_composition(self) -> None:
@@ -223,7 +232,7 @@ class CustomHandlerTest(absltest.TestCase):
                 np.testing.assert_allclose(p2, p3)
                 np.testing.assert_allclose(p2, p4)
 
-        asyncio.get_event_loop().run_until_complete(_test(self))
+        self.loop.run_until_complete(_test(self))
 
     def test_custom_model_with_artifacts(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -248,7 +257,7 @@ class CustomHandlerTest(absltest.TestCase):
             assert pk.meta
             assert isinstance(pk.model, DemoModelWithArtifacts)
             res = pk.model.predict(d)
-            np.testing.assert_allclose(res["output"], pd.Series(np.array([11, 14])))
+            np.testing.assert_array_equal(res["output"].to_numpy(), np.array([11, 14]))
 
             # test re-init when loading the model
             with open(
@@ -263,7 +272,7 @@ class CustomHandlerTest(absltest.TestCase):
             assert isinstance(pk.model, DemoModelWithArtifacts)
             res = pk.model.predict(d)
 
-            np.testing.assert_allclose(res["output"], pd.Series(np.array([21, 24])))
+            np.testing.assert_array_equal(res["output"].to_numpy(), np.array([21, 24]))
             self.assertEqual(pk.meta.metadata["author"] if pk.meta.metadata else None, "halu")
 
     def test_custom_model_with_partitioned_inference(self) -> None:
@@ -289,7 +298,7 @@ class CustomHandlerTest(absltest.TestCase):
             }
             assert isinstance(pk.model, PartitionedDemoModel)
             res = pk.model.predict(d)
-            np.testing.assert_allclose(res["output"], pd.Series(np.array([1, 4])))
+            np.testing.assert_array_equal(res["output"].to_numpy(), np.array([1, 4]))
 
 
 if __name__ == "__main__":
@@ -12,12 +12,17 @@ from snowflake.ml.model._packager import model_packager
 
 
 class SKLearnHandlerTest(absltest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Tests only round-trip the models they fit, so they can share the dataset.
+        iris_X, cls.iris_y = datasets.load_iris(return_X_y=True)
+        cls.iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
+
     def test_skl_multiple_output_proba(self) -> None:
-        iris_X, iris_y = datasets.load_iris(return_X_y=True)
-        target2 = np.random.randint(0, 6, size=iris_y.shape)
-        dual_target = np.vstack([iris_y, target2]).T
-        model = multioutput.MultiOutputClassifier(ensemble.RandomForestClassifier(random_state=42))
-        iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
+        iris_X_df, iris_y = self.iris_X_df, self.iris_y
+        target2 = np.random.default_rng(0).integers(0, 6, size=iris_y.shape)
+        dual_target = np.column_stack([iris_y, target2])
+        model = multioutput.MultiOutputClassifier(ensemble.RandomForestClassifier(n_estimators=5, random_state=42))
         model.fit(iris_X_df[:-10], dual_target[:-10])
         with tempfile.TemporaryDirectory() as tmpdir:
             s = {"predict_proba": model_signature.infer_signature(iris_X_df, model.predict_proba(iris_X_df))}
@@ -29,15 +34,17 @@ class SKLearnHandlerTest(absltest.TestCase):
                 conda_dependencies=["scikit-learn"],
             )
 
-            orig_res = model.predict_proba(iris_X_df[-10:])
+            iris_X_df_tail = iris_X_df[-10:]
+            expected_proba = np.hstack(model.predict_proba(iris_X_df_tail))
+            expected_pred = model.predict(iris_X_df_tail)
 
             pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
             pk.load()
             assert pk.model
             assert pk.meta
             assert isinstance(pk.model, multioutput.MultiOutputClassifier)
-            loaded_res = pk.model.predict_proba(iris_X_df[-10:])
-            np.testing.assert_allclose(np.hstack(orig_res), np.hstack(loaded_res))
+            loaded_res = pk.model.predict_proba(iris_X_df_tail)
+            np.testing.assert_allclose(expected_proba, np.hstack(loaded_res))
 
             pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
             pk.load(as_custom_model=True)
@@ -45,10 +52,8 @@ class SKLearnHandlerTest(absltest.TestCase):
             assert pk.meta
             predict_method = getattr(pk.model, "predict_proba", None)
             assert callable(predict_method)
-            udf_res = predict_method(iris_X_df[-10:])
-            np.testing.assert_allclose(
-                np.hstack(orig_res), np.hstack([np.array(udf_res[col].to_list()) for col in udf_res])
-            )
+            udf_res = predict_method(iris_X_df_tail)
+            np.testing.assert_allclose(expected_proba, np.hstack([np.array(udf_res[col].to_list()) for col in udf_res]))
 
             with self.assertRaises(ValueError):
                 model_packager.ModelPackager(local_dir_path=os.path.join(tmpdir, "model1_no_sig_bad")).save(
@@ -71,10 +76,8 @@ class SKLearnHandlerTest(absltest.TestCase):
             assert pk.model
             assert pk.meta
             assert isinstance(pk.model, multioutput.MultiOutputClassifier)
-            np.testing.assert_allclose(
-                np.hstack(model.predict_proba(iris_X_df[-10:])), np.hstack(pk.model.predict_proba(iris_X_df[-10:]))
-            )
-            np.testing.assert_allclose(model.predict(iris_X_df[-10:]), pk.model.predict(iris_X_df[-10:]))
+            np.testing.assert_allclose(expected_proba, np.hstack(pk.model.predict_proba(iris_X_df_tail)))
+            np.testing.assert_allclose(expected_pred, pk.model.predict(iris_X_df_tail))
             self.assertEqual(s["predict_proba"], pk.meta.signatures["predict_proba"])
 
             pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1_no_sig"))
@@ -84,20 +87,19 @@ class SKLearnHandlerTest(absltest.TestCase):
 
             predict_method = getattr(pk.model, "predict_proba", None)
             assert callable(predict_method)
-            udf_res = predict_method(iris_X_df[-10:])
+            udf_res = predict_method(iris_X_df_tail)
             np.testing.assert_allclose(
-                np.hstack(model.predict_proba(iris_X_df[-10:])),
+                expected_proba,
                 np.hstack([np.array(udf_res[col].to_list()) for col in udf_res]),
             )
 
             predict_method = getattr(pk.model, "predict", None)
             assert callable(predict_method)
-            np.testing.assert_allclose(model.predict(iris_X_df[-10:]), predict_method(iris_X_df[-10:]).to_numpy())
+            np.testing.assert_allclose(expected_pred, predict_method(iris_X_df_tail).to_numpy())
 
     def test_skl(self) -> None:
-        iris_X, iris_y = datasets.load_iris(return_X_y=True)
+        iris_X_df, iris_y = self.iris_X_df, self.iris_y
         regr = linear_model.LinearRegression()
-        iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
         regr.fit(iris_X_df, iris_y)
         with tempfile.TemporaryDirectory() as tmpdir:
             s = {"predict": model_signature.infer_signature(iris_X_df, regr.predict(iris_X_df))}
@@ -13,11 +13,18 @@ from snowflake.ml.model._packager import model_packager
 
 
 class XgboostHandlerTest(absltest.TestCase):
-    def test_xgb_booster(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Tests only round-trip the models they fit, so they can share the dataset.
         cal_data = datasets.load_breast_cancer()
         cal_X = pd.DataFrame(cal_data.data, columns=cal_data.feature_names)
         cal_y = pd.Series(cal_data.target)
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
+        cls.cal_X_train, cls.cal_X_test, cls.cal_y_train, _ = model_selection.train_test_split(
+            cal_X, cal_y, random_state=0
+        )
+
+    def test_xgb_booster(self) -> None:
+        cal_X_train, cal_X_test, cal_y_train = self.cal_X_train, self.cal_X_test, self.cal_y_train
         params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
         regressor = xgboost.train(params, xgboost.DMatrix(data=cal_X_train, label=cal_y_train))
         y_pred = regressor.predict(xgboost.DMatrix(data=cal_X_test))
@@ -79,11 +86,8 @@ class XgboostHandlerTest(absltest.TestCase):
             np.testing.assert_allclose(predict_method(cal_X_test), np.expand_dims(y_pred, axis=1))
 
     def test_xgb(self) -> None:
-        cal_data = datasets.load_breast_cancer()
-        cal_X = pd.DataFrame(cal_data.data, columns=cal_data.feature_names)
-        cal_y = pd.Series(cal_data.target)
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        regressor = xgboost.XGBClassifier(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
+        cal_X_train, cal_X_test, cal_y_train = self.cal_X_train, self.cal_X_test, self.cal_y_train
+        regressor = xgboost.XGBClassifier(n_estimators=5, reg_lambda=1, gamma=0, max_depth=3)
         regressor.fit(cal_X_train, cal_y_train)
         y_pred = regressor.predict(cal_X_test)
         y_pred_proba = regressor.predict_proba(cal_X_test)
@@ -112,14 +116,14 @@ class XgboostHandlerTest(absltest.TestCase):
                 assert pk.model
                 assert pk.meta
                 assert isinstance(pk.model, xgboost.XGBClassifier)
-                np.testing.assert_allclose(pk.model.predict(cal_X_test), y_pred)
+                np.testing.assert_array_equal(pk.model.predict(cal_X_test), y_pred)
                 pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
                 pk.load(as_custom_model=True)
                 assert pk.model
                 assert pk.meta
                 predict_method = getattr(pk.model, "predict", None)
                 assert callable(predict_method)
-                np.testing.assert_allclose(predict_method(cal_X_test), np.expand_dims(y_pred, axis=1))
+                np.testing.assert_array_equal(predict_method(cal_X_test), np.expand_dims(y_pred, axis=1))
 
             model_packager.ModelPackager(os.path.join(tmpdir, "model1_no_sig")).save(
                 name="model1_no_sig",
@@ -133,7 +137,7 @@ class XgboostHandlerTest(absltest.TestCase):
             assert pk.model
             assert pk.meta
             assert isinstance(pk.model, xgboost.XGBClassifier)
-            np.testing.assert_allclose(pk.model.predict(cal_X_test), y_pred)
+            np.testing.assert_array_equal(pk.model.predict(cal_X_test), y_pred)
             np.testing.assert_allclose(pk.model.predict_proba(cal_X_test), y_pred_proba)
             self.assertEqual(s["predict"], pk.meta.signatures["predict"])
 
@@ -143,7 +147,7 @@ class XgboostHandlerTest(absltest.TestCase):
             assert pk.meta
             predict_method = getattr(pk.model, "predict", None)
             assert callable(predict_method)
-            np.testing.assert_allclose(predict_method(cal_X_test), np.expand_dims(y_pred, axis=1))
+            np.testing.assert_array_equal(predict_method(cal_X_test), np.expand_dims(y_pred, axis=1))
 
             predict_method = getattr(pk.model, "predict_proba", None)
             assert callable(predict_method)
@@ -1,4 +1,5 @@
 import os
+import pathlib
 import sys
 import tempfile
 from importlib import metadata as importlib_metadata
@@ -21,11 +22,8 @@ from snowflake.ml.test_utils import exception_utils
 class DemoModelWithManyArtifacts(custom_model.CustomModel):
     def __init__(self, context: custom_model.ModelContext) -> None:
         super().__init__(context)
-        with open(os.path.join(context.path("bias"), "bias1"), encoding="utf-8") as f:
-            v1 = int(f.read())
-        with open(os.path.join(context.path("bias"), "bias2"), encoding="utf-8") as f:
-            v2 = int(f.read())
-        self.bias = v1 + v2
+        bias_dir = pathlib.Path(context.path("bias"))
+        self.bias = sum(int((bias_dir / name).read_text(encoding="utf-8")) for name in ["bias1", "bias2"])
 
     @custom_model.inference_api
     def predict(self, input: pd.DataFrame) -> pd.DataFrame:
@@ -1,9 +1,12 @@
+import collections
+import hashlib
 import importlib
+import io
 import inspect
 import os
 import posixpath
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 from uuid import uuid4
 
 import cloudpickle as cp
@@ -25,12 +28,40 @@ from snowflake.snowpark._internal.utils import (
     random_name_for_temp_object,
 )
 
-cp.register_pickle_by_value(inspect.getmodule(temp_file_utils.get_temp_file_path))
-cp.register_pickle_by_value(inspect.getmodule(identifier.get_inferred_name))
-cp.register_pickle_by_value(inspect.getmodule(handle_inference_result))
-
 _PROJECT = "ModelDevelopment"
 
+_pickle_by_value_registered = False
+
+# Temporary batch inference UDFs already registered in a session, most recently used last.
+_BATCH_INFERENCE_UDF_CACHE_SIZE = 64
+_batch_inference_udf_cache: "collections.OrderedDict[Tuple[Hashable, ...], str]" = collections.OrderedDict()
+
+
+def _register_pickle_by_value() -> None:
+    """
+    Register the helper modules used inside the UDF and sproc to be pickled by value, on first use only.
+    """
+    global _pickle_by_value_registered
+    if _pickle_by_value_registered:
+        return
+    cp.register_pickle_by_value(inspect.getmodule(temp_file_utils.get_temp_file_path))
+    cp.register_pickle_by_value(inspect.getmodule(identifier.get_inferred_name))
+    cp.register_pickle_by_value(inspect.getmodule(handle_inference_result))
+    _pickle_by_value_registered = True
+
+
+def _get_put_parallelism(num_bytes: int) -> int:
+    """
+    Get the PUT parallelism for uploading a file of the given size, one thread per 4 MiB between 4 and 16.
+
+    Args:
+        num_bytes: Size of the file to upload.
+
+    Returns:
+        Number of threads to use for the upload.
+    """
+    return min(16, max(4, num_bytes // (4 * 1024 * 1024)))
+
 
 def _get_rand_id() -> str:
     """
@@ -94,6 +125,7 @@ class SnowparkTransformHandlers:
             A new dataset of the same type as the input dataset.
         """
 
+        _register_pickle_by_value()
         dependencies = self._get_validated_snowpark_dependencies(session, dependencies)
         dataset = self.dataset
 
@@ -105,19 +137,6 @@ class SnowparkTransformHandlers:
             custom_tags={"autogen": True} if self._autogenerated else None,
         )
 
-        temp_stage_name = estimator_utils.create_temp_stage(session)
-
-        estimator_file_name = estimator_utils.upload_model_to_stage(
-            stage_name=temp_stage_name,
-            estimator=self.estimator,
-            session=session,
-            statement_params=statement_params,
-        )
-        imports = [f"@{temp_stage_name}/{estimator_file_name}"]
-
-        # Register vectorized UDF for batch inference
-        batch_inference_udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
-
         dataset = snowpark_dataframe_utils.cast_snowpark_dataframe_column_types(dataset)
         # Align the input_cols with snowpark dataframe's column name
         # This step also makes sure that the every col in input_cols exists in the current dataset
@@ -130,54 +149,42 @@ class SnowparkTransformHandlers:
         for field in fields:
             input_datatypes.append(field.datatype)
 
-        # TODO(xjiang): for optimization, use register_from_file to reduce duplicate loading estimator object
-        # or use cachetools here
-        def load_estimator() -> object:
-            estimator_file_path = os.path.join(sys._xoptions["snowflake_import_directory"], f"{estimator_file_name}")
-            with open(estimator_file_path, mode="rb") as local_estimator_file_obj:
-                estimator_object = cp.load(local_estimator_file_obj)
-            return estimator_object
-
-        @F.pandas_udf(  # type: ignore[arg-type, misc]
-            is_permanent=False,
-            name=batch_inference_udf_name,
-            packages=dependencies,  # type: ignore[arg-type]
-            replace=True,
-            session=session,
-            statement_params=statement_params,
-            input_types=[T.PandasDataFrameType(input_datatypes)],
-            imports=imports,  # type: ignore[arg-type]
-        )
-        def vec_batch_infer(input_df: pd.DataFrame) -> T.PandasSeries[dict]:  # type: ignore[type-arg]
-            import numpy as np  # noqa: F401
-            import pandas as pd
-
-            input_df.columns = snowpark_cols
-
-            estimator = load_estimator()
-
-            if hasattr(estimator, "n_jobs"):
-                # Vectorized UDF cannot handle joblib multiprocessing right now, deactivate the n_jobs
-                estimator.n_jobs = 1
-            inference_res = getattr(estimator, inference_method)(input_df, *args, **kwargs)
+        # The temporary UDF only depends on the estimator state and the inference signature, so a UDF registered
+        # by an earlier call in the same session and schema is reused instead of uploading and creating it again.
+        # Calls with extra args are not cached as those are captured by the UDF but are not reliably hashable.
+        cache_key: Optional[Tuple[Hashable, ...]] = None
+        if not args and not kwargs:
+            cache_key = (
+                session.session_id,
+                session.get_current_database(),
+                session.get_current_schema(),
+                hashlib.sha256(cp.dumps(self.estimator)).hexdigest(),
+                inference_method,
+                tuple(snowpark_cols),
+                tuple(str(datatype) for datatype in input_datatypes),
+                tuple(expected_output_cols),
+                tuple(dependencies),
+            )
 
-            transformed_numpy_array, _ = handle_inference_result(
-                inference_res=inference_res,
-                output_cols=expected_output_cols,
+        if cache_key is not None and cache_key in _batch_inference_udf_cache:
+            _batch_inference_udf_cache.move_to_end(cache_key)
+            batch_inference_udf_name = _batch_inference_udf_cache[cache_key]
+        else:
+            batch_inference_udf_name = self._register_batch_inference_udf(
+                session=session,
+                statement_params=statement_params,
+                dependencies=dependencies,
                 inference_method=inference_method,
-                within_udf=True,
+                snowpark_cols=snowpark_cols,
+                input_datatypes=input_datatypes,
+                expected_output_cols=expected_output_cols,
+                args=args,
+                kwargs=kwargs,
             )
-
-            if len(transformed_numpy_array.shape) > 1:
-                if transformed_numpy_array.shape[1] != len(expected_output_cols):
-                    series = pd.Series(transformed_numpy_array.tolist())
-                    transformed_pandas_df = pd.DataFrame(series, columns=expected_output_cols)
-                else:
-                    transformed_pandas_df = pd.DataFrame(transformed_numpy_array.tolist(), columns=expected_output_cols)
-            else:
-                transformed_pandas_df = pd.DataFrame(transformed_numpy_array, columns=expected_output_cols)
-
-            return transformed_pandas_df.to_dict("records")  # type: ignore[no-any-return]
+            if cache_key is not None:
+                _batch_inference_udf_cache[cache_key] = batch_inference_udf_name
+                if len(_batch_inference_udf_cache) > _BATCH_INFERENCE_UDF_CACHE_SIZE:
+                    _batch_inference_udf_cache.popitem(last=False)
 
         # Run Transform and get intermediate result
         INTERMEDIATE_OBJ_NAME = "tmp_result"
@@ -235,6 +242,7 @@ class SnowparkTransformHandlers:
         Returns:
             An accuracy score for the model on the given test data.
         """
+        _register_pickle_by_value()
         dependencies = self._get_validated_snowpark_dependencies(session, dependencies)
         dependencies.append("snowflake-snowpark-python")
         dataset = self.dataset
@@ -244,11 +252,6 @@ class SnowparkTransformHandlers:
         # Extract queries that generated the dataframe. We will need to pass it to score procedure.
         queries = dataset.queries["queries"]
 
-        # Create a temp file and dump the score to that file.
-        local_score_file_name = temp_file_utils.get_temp_file_path()
-        with open(local_score_file_name, mode="w+b") as local_score_file:
-            cp.dump(estimator, local_score_file)
-
         # Create temp stage to run score.
         score_stage_name = random_name_for_temp_object(TempObjectType.STAGE)
         assert session is not None  # keep mypy happy
@@ -258,7 +261,7 @@ class SnowparkTransformHandlers:
         ).validate()
 
         # Use posixpath to construct stage paths
-        stage_score_file_name = posixpath.join(score_stage_name, os.path.basename(local_score_file_name))
+        stage_score_file_name = posixpath.join(score_stage_name, _get_rand_id())
         score_sproc_name = random_name_for_temp_object(TempObjectType.PROCEDURE)
         statement_params = telemetry.get_function_usage_statement_params(
             project=_PROJECT,
@@ -269,14 +272,18 @@ class SnowparkTransformHandlers:
             api_calls=[F.sproc],
             custom_tags={"autogen": True} if self._autogenerated else None,
         )
-        # Put locally serialized score on stage.
-        session.file.put(
-            local_score_file_name,
-            stage_score_file_name,
-            auto_compress=False,
-            overwrite=True,
-            statement_params=statement_params,
-        )
+        # Serialize the estimator in memory and stream it to the stage, no local temp file is needed.
+        with io.BytesIO() as estimator_stream:
+            cp.dump(estimator, estimator_stream)
+            estimator_size = estimator_stream.tell()
+            estimator_stream.seek(0)
+            session.file.put_stream(
+                estimator_stream,
+                stage_score_file_name,
+                parallel=_get_put_parallelism(estimator_size),
+                auto_compress=False,
+                overwrite=True,
+            )
 
         @F.sproc(  # type: ignore[misc]
             is_permanent=False,
@@ -309,7 +316,10 @@ class SnowparkTransformHandlers:
                 _ = session.sql(query).collect(statement_params=score_statement_params)
             sp_df = session.sql(sql_queries[-1])
             df: pd.DataFrame = sp_df.to_pandas(statement_params=score_statement_params)
-            df.columns = sp_df.columns
+            # Only quoted identifiers differ between the result set names and the snowpark column names.
+            sp_df_columns = sp_df.columns
+            if df.columns.tolist() != sp_df_columns:
+                df.columns = sp_df_columns
 
             local_score_file_name = temp_file_utils.get_temp_file_path()
             session.file.get(stage_score_file_name, local_score_file_name, statement_params=score_statement_params)
@@ -359,10 +369,105 @@ class SnowparkTransformHandlers:
             **kwargs,
         )
 
-        temp_file_utils.cleanup_temp_files([local_score_file_name])
-
         return score
 
+    def _register_batch_inference_udf(
+        self,
+        session: Session,
+        statement_params: Dict[str, Any],
+        dependencies: List[str],
+        inference_method: str,
+        snowpark_cols: List[str],
+        input_datatypes: List[T.DataType],
+        expected_output_cols: List[str],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Upload the estimator and register a temporary vectorized UDF running batch inference with it.
+
+        Args:
+            session: An active Snowpark Session.
+            statement_params: Statement parameters for query telemetry.
+            dependencies: Validated list of dependencies for the transformer.
+            inference_method: the name of the method used by `estimator` to run inference.
+            snowpark_cols: Feature columns for inference, as named in the input dataset.
+            input_datatypes: Datatypes of the feature columns.
+            expected_output_cols: column names (in order) of the output dataset.
+            args: additional positional arguments.
+            kwargs: additional keyword args.
+
+        Returns:
+            The name of the registered UDF.
+        """
+        temp_stage_name = estimator_utils.create_temp_stage(session)
+
+        estimator_file_name = estimator_utils.upload_model_to_stage(
+            stage_name=temp_stage_name,
+            estimator=self.estimator,
+            session=session,
+            statement_params=statement_params,
+        )
+        imports = [f"@{temp_stage_name}/{estimator_file_name}"]
+
+        # Register vectorized UDF for batch inference
+        batch_inference_udf_name = random_name_for_temp_object(TempObjectType.FUNCTION)
+
+        # The UDF is unpickled once per Python worker, so this dict lives across all batches the worker handles and
+        # the estimator is only loaded and prepared on the first one.
+        loaded_estimator: Dict[str, object] = {}
+
+        def load_estimator() -> object:
+            if "estimator" not in loaded_estimator:
+                estimator_file_path = os.path.join(
+                    sys._xoptions["snowflake_import_directory"], f"{estimator_file_name}"
+                )
+                with open(estimator_file_path, mode="rb") as local_estimator_file_obj:
+                    estimator_object = cp.load(local_estimator_file_obj)
+                if hasattr(estimator_object, "n_jobs"):
+                    # Vectorized UDF cannot handle joblib multiprocessing right now, deactivate the n_jobs
+                    estimator_object.n_jobs = 1
+                loaded_estimator["estimator"] = estimator_object
+            return loaded_estimator["estimator"]
+
+        @F.pandas_udf(  # type: ignore[arg-type, misc]
+            is_permanent=False,
+            name=batch_inference_udf_name,
+            packages=dependencies,  # type: ignore[arg-type]
+            replace=True,
+            session=session,
+            statement_params=statement_params,
+            input_types=[T.PandasDataFrameType(input_datatypes)],
+            imports=imports,  # type: ignore[arg-type]
+        )
+        def vec_batch_infer(input_df: pd.DataFrame) -> T.PandasSeries[dict]:  # type: ignore[type-arg]
+            import numpy as np  # noqa: F401
+            import pandas as pd
+
+            input_df.columns = snowpark_cols
+
+            estimator = load_estimator()
+            inference_res = getattr(estimator, inference_method)(input_df, *args, **kwargs)
+
+            transformed_numpy_array, _ = handle_inference_result(
+                inference_res=inference_res,
+                output_cols=expected_output_cols,
+                inference_method=inference_method,
+                within_udf=True,
+            )
+
+            if len(transformed_numpy_array.shape) > 1 and transformed_numpy_array.shape[1] != len(expected_output_cols):
+                series = pd.Series(transformed_numpy_array.tolist())
+                transformed_pandas_df = pd.DataFrame(series, columns=expected_output_cols)
+                return transformed_pandas_df.to_dict("records")  # type: ignore[no-any-return]
+
+            # Build the records straight from the array rows instead of going through an intermediate DataFrame.
+            rows = transformed_numpy_array.tolist()
+            if len(transformed_numpy_array.shape) == 1:
+                rows = [[value] for value in rows]
+            return [dict(zip(expected_output_cols, row)) for row in rows]  # type: ignore[return-value]
+
+        return batch_inference_udf_name
+
     def _get_validated_snowpark_dependencies(self, session: Session, dependencies: List[str]) -> List[str]:
         """A helper function to validate dependencies and return the available packages that exists
         in the snowflake anaconda channel
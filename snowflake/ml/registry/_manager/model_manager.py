@@ -139,38 +139,38 @@ class ModelManager:
 
         logger.info("Start packaging and uploading your model. It might take some time based on the size of the model.")
 
-        mc = model_composer.ModelComposer(
+        with model_composer.ModelComposer(
             self._model_ops._session, stage_path=stage_path, statement_params=statement_params
-        )
-        model_metadata: model_meta.ModelMetadata = mc.save(
-            name=model_name_id.resolved(),
-            model=model,
-            signatures=signatures,
-            sample_input_data=sample_input_data,
-            conda_dependencies=conda_dependencies,
-            pip_requirements=pip_requirements,
-            python_version=python_version,
-            code_paths=code_paths,
-            ext_modules=ext_modules,
-            options=options,
-        )
-        statement_params = telemetry.add_statement_params_custom_tags(
-            statement_params, model_metadata.telemetry_metadata()
-        )
-        statement_params = telemetry.add_statement_params_custom_tags(
-            statement_params, {"model_version_name": version_name_id}
-        )
+        ) as mc:
+            model_metadata: model_meta.ModelMetadata = mc.save(
+                name=model_name_id.resolved(),
+                model=model,
+                signatures=signatures,
+                sample_input_data=sample_input_data,
+                conda_dependencies=conda_dependencies,
+                pip_requirements=pip_requirements,
+                python_version=python_version,
+                code_paths=code_paths,
+                ext_modules=ext_modules,
+                options=options,
+            )
+            statement_params = telemetry.add_statement_params_custom_tags(
+                statement_params, model_metadata.telemetry_metadata()
+            )
+            statement_params = telemetry.add_statement_params_custom_tags(
+                statement_params, {"model_version_name": version_name_id}
+            )
 
-        logger.info("Start creating MODEL object for you in the Snowflake.")
+            logger.info("Start creating MODEL object for you in the Snowflake.")
 
-        self._model_ops.create_from_stage(
-            composed_model=mc,
-            database_name=database_name_id,
-            schema_name=schema_name_id,
-            model_name=model_name_id,
-            version_name=version_name_id,
-            statement_params=statement_params,
-        )
+            self._model_ops.create_from_stage(
+                composed_model=mc,
+                database_name=database_name_id,
+                schema_name=schema_name_id,
+                model_name=model_name_id,
+                version_name=version_name_id,
+                statement_params=statement_params,
+            )
 
         mv = model_version_impl.ModelVersion._ref(
             model_ops.ModelOperator(
@@ -142,8 +142,8 @@ def init(session: Optional[snowpark.Session] = None, enable_relax_version: Optio
     ) -> T.PandasSeries[dict]:  # type: ignore[type-arg]
         from snowflake.snowpark import files
 
-        dataset = pd.json_normalize(ds)
-        dataset = dataset[cols[0]]
+        # Rows are flat dicts, build the frame directly from them keeping only the requested columns.
+        dataset = pd.DataFrame.from_records(ds.tolist(), columns=cols[0])
         with files.SnowflakeFile.open(model_file_location[0], mode="rb") as model_file:
             model = cloudpickle.load(model_file)
         args = cloudpickle.loads(args_data[0])